@@ -1,8 +1,25 @@
+import functools
+import os
 import re
-from collections import Counter
+import sys
 from typing import Dict, Any, Iterator, Tuple, Optional, Union
 
 
+@functools.lru_cache(maxsize=None)
+def _param_re(key: str) -> re.Pattern:
+    """Compiled pattern for a parameter key; each key compiles exactly once."""
+    return re.compile(rf'(?mi)^\s*{re.escape(key)}\s*=\s*(?:"([^"]*)"|([^\s\\\r\n]+))')
+
+
+# Axis-parallel tolerance for groove direction classification
+_AXIS_EPS = 1e-6
+
+
+# Matches any NAME=VALUE parameter line; used to pull all parameters of a
+# block in a single scan instead of one _get_param scan per key.
+_ALL_PARAMS_RE = re.compile(r'(?mi)^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?:"([^"]*)"|([^\s\\\r\n]+))')
+
+
 # ---------------------------------------------------------------------
 # 1) ID-only process dictionary (authoritative matching by numeric ID)
 # ---------------------------------------------------------------------
@@ -89,39 +106,76 @@ def _read_text_input(mpr_input: Union[str, bytes]) -> str:
     Returns decoded text.
     """
     if isinstance(mpr_input, bytes):
-        for enc in ("utf-8-sig", "utf-8", "cp1252", "latin-1"):
-            try:
-                return mpr_input.decode(enc)
-            except UnicodeDecodeError:
-                pass
-        return mpr_input.decode("latin-1", errors="replace")
+        # BOM sniff first, then a single utf-8 attempt; anything else is
+        # effectively cp1252 in practice, so decode once with replacement
+        # instead of retrying the whole buffer per codec.
+        if mpr_input.startswith(b"\xef\xbb\xbf"):
+            return mpr_input.decode("utf-8-sig")
+        try:
+            return mpr_input.decode("utf-8")
+        except UnicodeDecodeError:
+            return mpr_input.decode("cp1252", errors="replace")
 
     if isinstance(mpr_input, str):
         # If it's a real path, read it; otherwise treat as content.
-        try:
-            with open(mpr_input, "rb") as f:
-                return _read_text_input(f.read())
-        except (FileNotFoundError, OSError):
-            return mpr_input
+        # Cheap gate first: raw MPR text is long and/or multi-line, so skip
+        # the filesystem lookup (and exception) for obvious non-paths.
+        if len(mpr_input) < 4096 and "\n" not in mpr_input and os.path.isfile(mpr_input):
+            try:
+                with open(mpr_input, "rb") as f:
+                    return _read_text_input(f.read())
+            except OSError:
+                return mpr_input
+        return mpr_input
 
     raise TypeError("mpr_input must be a file path (str), raw text (str), or raw bytes (bytes).")
 
 
-def _iter_mpr_macro_blocks(text: str) -> Iterator[Tuple[int, str]]:
+def _iter_mpr_macro_blocks(text: str) -> Iterator[Tuple[int, Dict[str, str]]]:
     """
-    Yields (macro_id, macro_block_text).
+    Yields (macro_id, params) where params maps upper-cased parameter names
+    to their first value in the block.
 
     IMPORTANT: Matching is based ONLY on macro ID, not macro name.
     Macro header pattern: <102 \...\
     We only rely on: ^\s*<\s*(\d+)\s*\
+
+    A header is a line whose first non-blank characters are <digits\ (with
+    optional spaces); the scan jumps between '<' candidates with str.find,
+    and parameters are parsed in the same sweep directly on the file text
+    (via pos/endpos), so no per-block substring is ever allocated.
     """
-    header_re = re.compile(r'(?m)^\s*<\s*(\d+)\s*\\')
-    matches = list(header_re.finditer(text))
-    for i, m in enumerate(matches):
-        start = m.start()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        macro_id = int(m.group(1))
-        yield macro_id, text[start:end]
+    n = len(text)
+    prev_id = None
+    prev_start = 0
+    pos = 0
+    while True:
+        # Jump between '<' candidates in C instead of visiting every line
+        # start in Python; non-header lines are skipped wholesale.
+        i = text.find("<", pos)
+        if i < 0:
+            break
+        # A header's '<' must be the first non-blank character of its line.
+        line_start = text.rfind("\n", 0, i) + 1
+        if text[line_start:i].lstrip(" \t") == "":
+            j = i + 1
+            while j < n and text[j] in " \t":
+                j += 1
+            k = j
+            while k < n and text[k].isdigit():
+                k += 1
+            m = k
+            while m < n and text[m] in " \t":
+                m += 1
+            if k > j and m < n and text[m] == "\\":
+                # New header: emit the block that just ended.
+                if prev_id is not None:
+                    yield prev_id, _parse_params(text, prev_start, line_start)
+                prev_id = int(text[j:k])
+                prev_start = line_start
+        pos = i + 1
+    if prev_id is not None:
+        yield prev_id, _parse_params(text, prev_start, n)
 
 
 def _get_param(block: str, key: str) -> Optional[str]:
@@ -129,15 +183,53 @@ def _get_param(block: str, key: str) -> Optional[str]:
     Extracts parameter values like:
       BM="LSL"  or  DU="5"  or  T_="123"
     """
-    pattern = re.compile(rf'(?mi)^\s*{re.escape(key)}\s*=\s*(?:"([^"]*)"|([^\s\\\r\n]+))')
-    m = pattern.search(block)
+    m = _param_re(key).search(block)
     if not m:
         return None
     return (m.group(1) if m.group(1) is not None else m.group(2)).strip()
 
 
+def _parse_params(block: str, start: int = 0, end: Optional[int] = None) -> Dict[str, str]:
+    """
+    Extracts every parameter of a block in one pass, e.g.
+      BM="LSL"  and  DU="5"  and  T_="123"
+    Keys are upper-cased; the first occurrence of a key wins, matching
+    _get_param's first-match semantics. start/end restrict the scan to a
+    region of a larger text without slicing a substring out of it.
+    """
+    params: Dict[str, str] = {}
+    for m in _ALL_PARAMS_RE.finditer(block, start, len(block) if end is None else end):
+        # Intern the key: the same handful of names (BM, DU, XA, ...) is
+        # parsed out of every block, so share one string per name instead
+        # of allocating and hashing a fresh copy each time.
+        key = sys.intern(m.group(1).upper())
+        if key not in params:
+            value = m.group(2) if m.group(2) is not None else m.group(3)
+            params[key] = value.strip()
+    return params
+
+
+def _safe_float(val: Optional[str]) -> Optional[float]:
+    if val is None:
+        return None
+    try:
+        return float(val)
+    except ValueError:
+        return None
+
+
 def _format_diameter(du_raw: Optional[str], tool_raw: Optional[str], *, tool_prefix: str = "Tool") -> str:
     if du_raw:
+        # Fast string path for the overwhelmingly common "8" / "5.0" forms;
+        # avoids the float round-trip. Leading zeros fall through so the
+        # float branch keeps normalizing them.
+        if du_raw.isdigit():
+            if du_raw == "0" or du_raw[0] != "0":
+                return f"{du_raw}D"
+        elif du_raw.endswith(".0") and du_raw[:-2].isdigit():
+            head = du_raw[:-2]
+            if head == "0" or head[0] != "0":
+                return f"{head}D"
         try:
             v = float(du_raw)
             if abs(v - int(v)) < 1e-9:
@@ -175,10 +267,12 @@ BM_SUFFIX_MAP_VERT = {
     "LSLU": "FromBottom",
 }
 
-def bohrvert_signature(block: str) -> str:
-    bm = (_get_param(block, "BM") or "").upper()
-    du = _get_param(block, "DU")
-    tno = _get_param(block, "TNO")  # common alternative for vertical
+def bohrvert_signature(params: Dict[str, str]) -> str:
+    bm_raw = params.get("BM") or ""
+    # BM tokens are already uppercase in practice; skip the fresh allocation
+    bm = bm_raw if bm_raw.isupper() or not bm_raw else bm_raw.upper()
+    du = params.get("DU")
+    tno = params.get("TNO")  # common alternative for vertical
     diam = _format_diameter(du, tno, tool_prefix="Tool")
 
     style = BM_STYLE_MAP_VERT.get(bm, f"BM{bm or 'UNK'}")
@@ -194,16 +288,17 @@ BM_DIR_MAP_HORIZ = {
     "YM": "-Y",
 }
 
-def bohrhoriz_signature(block: str) -> str:
-    bm = (_get_param(block, "BM") or "").upper()
-    du = _get_param(block, "DU")
-    t_ = _get_param(block, "T_")  # common alternative for horizontal
+def bohrhoriz_signature(params: Dict[str, str]) -> str:
+    bm_raw = params.get("BM") or ""
+    bm = bm_raw if bm_raw.isupper() or not bm_raw else bm_raw.upper()
+    du = params.get("DU")
+    t_ = params.get("T_")  # common alternative for horizontal
     diam = _format_diameter(du, t_, tool_prefix="Tool")
 
     if bm in BM_DIR_MAP_HORIZ:
         dir_part = BM_DIR_MAP_HORIZ[bm]
     elif bm == "C":
-        wi = _get_param(block, "WI")  # optional free C-angle
+        wi = params.get("WI")  # optional free C-angle
         dir_part = f"C{wi}" if wi else "C"
     else:
         dir_part = f"BM{bm or 'UNK'}"
@@ -214,34 +309,87 @@ def bohrhoriz_signature(block: str) -> str:
 # ---------------------------------------------------------------------
 # 4) Main: map + count (ID-only matching)
 # ---------------------------------------------------------------------
+def _handle_vert_drill(macro_id: int, params: Dict[str, str], ctx: Dict[str, Any]) -> None:
+    sig = bohrvert_signature(params)
+    counts = ctx["bohrvert_sig_counts"]
+    counts[sig] = counts.get(sig, 0) + 1
+
+
+def _handle_horiz_drill(macro_id: int, params: Dict[str, str], ctx: Dict[str, Any]) -> None:
+    sig = bohrhoriz_signature(params)
+    counts = ctx["bohrhoriz_sig_counts"]
+    counts[sig] = counts.get(sig, 0) + 1
+
+
+def _handle_groove(macro_id: int, params: Dict[str, str], ctx: Dict[str, Any]) -> None:
+    # Collect the raw fields; the geometry math and string formatting run
+    # in one batch after the counting loop.
+    ctx["groove_records"].append((
+        macro_id,
+        params.get("XA"),
+        params.get("YA"),
+        params.get("XE"),
+        params.get("YE"),
+        (params.get("T_") or "").replace('"', "").replace("!", "").strip(),
+    ))
+
+
+# O(1) per-macro dispatch instead of an if/elif chain over IDs
+_SIGNATURE_HANDLERS = {
+    102: _handle_vert_drill,
+    103: _handle_horiz_drill,
+    109: _handle_groove,
+    124: _handle_groove,
+}
+
+
+
 def map_and_count_mpr_processes(
     mpr_input: Union[str, bytes],
     process_defs: Dict[int, str] = MPR_PROCESS_DEFS,
     *,
     include_disabled: bool = True,
+    compute_signatures: bool = True,
 ) -> Dict[str, Any]:
     """
     Counts macros by ID (authoritative), then enriches with:
       - mapped description (if ID exists in process_defs)
       - special signature counts for ID 102 and 103
       - angle groove lengths for ID 124 (XA/YA -> XE/YE)
+
+    Pass compute_signatures=False to skip the per-block parameter parsing
+    for 102/103/109/124 when only the raw ID counts are needed.
     """
     text = _read_text_input(mpr_input)
 
-    counts_by_id = Counter()
-    unknown_ids = Counter()
+    # Plain dicts with get()-based increments; cheaper than Counter's
+    # __missing__ dispatch in the per-macro loop.
+    counts_by_id: Dict[int, int] = {}
+    unknown_ids: Dict[int, int] = {}
 
-    bohrvert_sig_counts = Counter()
-    bohrhoriz_sig_counts = Counter()
+    bohrvert_sig_counts: Dict[str, int] = {}
+    bohrhoriz_sig_counts: Dict[str, int] = {}
     angle124_lengths = []
     groove109_lengths = []
+    groove_records = []  # (macro_id, xa, ya, xe, ye, t_flag) raw strings
+
+    # Shared state the per-ID handlers mutate
+    ctx: Dict[str, Any] = {
+        "bohrvert_sig_counts": bohrvert_sig_counts,
+        "bohrhoriz_sig_counts": bohrhoriz_sig_counts,
+        "groove_records": groove_records,
+    }
+
+    # Scan the file once; the block list is shared by the LA/BR pre-pass
+    # and the main counting loop below.
+    blocks = list(_iter_mpr_macro_blocks(text))
 
     la_100 = br_100 = 0.0
     # Pre-parse macro 100 for LA/BR
-    for macro_id, block in _iter_mpr_macro_blocks(text):
+    for macro_id, params in blocks:
         if macro_id == 100:
-            la_val = _get_param(block, "LA")
-            br_val = _get_param(block, "BR")
+            la_val = params.get("LA")
+            br_val = params.get("BR")
             try:
                 la_100 = float(la_val) if la_val is not None else 0.0
             except ValueError:
@@ -252,73 +400,71 @@ def map_and_count_mpr_processes(
                 br_100 = 0.0
             break
 
-    for macro_id, block in _iter_mpr_macro_blocks(text):
+    for macro_id, params in blocks:
         if not include_disabled:
-            en = _get_param(block, "EN")
-            if en is not None and en.strip() == "0":
+            if params.get("EN") == "0":
                 continue
 
-        counts_by_id[macro_id] += 1
+        counts_by_id[macro_id] = counts_by_id.get(macro_id, 0) + 1
         if macro_id not in process_defs:
-            unknown_ids[macro_id] += 1
-
-        if macro_id == 102:
-            bohrvert_sig_counts[bohrvert_signature(block)] += 1
-        elif macro_id == 103:
-            bohrhoriz_sig_counts[bohrhoriz_signature(block)] += 1
-        elif macro_id in (109, 124):
-            # Groove length from XA/YA to XE/YE (one delta should be zero)
-            def _safe_float(val: Optional[str]) -> Optional[float]:
-                if val is None:
-                    return None
-                try:
-                    return float(val)
-                except ValueError:
-                    return None
-
-            xa = _safe_float(_get_param(block, "XA"))
-            ya = _safe_float(_get_param(block, "YA"))
-            xe = _safe_float(_get_param(block, "XE"))
-            ye = _safe_float(_get_param(block, "YE"))
-            t_val = (_get_param(block, "T_") or "").replace('"', "").replace("!", "").strip()
-            if None not in (xa, ya, xe, ye):
-                dx = abs(xa - xe)
-                dy = abs(ya - ye)
-                is_below = macro_id == 109 and t_val.endswith("xxxxx2")
-                if macro_id == 124:
-                    if dy == 0:
-                        length_str = f"{dx}_On_PL<{la_100}>"
-                    elif dx == 0:
-                        length_str = f"{dy}_On_PW<{br_100}>"
-                    else:
-                        length_str = f"{max(dx, dy)}"
-                    angle124_lengths.append(length_str)
-                else:
-                    if dy == 0:
-                        suffix = "Milling_From_Below" if is_below else "Top_Saw_Grv"
-                        length_str = f"{dx}_On_PL<{la_100}_{suffix}>"
-                    elif dx == 0:
-                        suffix = "Milling_From_Below" if is_below else "Top_Saw_Grv"
-                        length_str = f"{dy}_On_PW<{br_100}_{suffix}>"
-                    else:
-                        length_str = f"{max(dx, dy)}"
-                    groove109_lengths.append(length_str)
-
-    # Build a mapped summary keyed by ID
+            unknown_ids[macro_id] = unknown_ids.get(macro_id, 0) + 1
+
+        if not compute_signatures:
+            continue
+
+        handler = _SIGNATURE_HANDLERS.get(macro_id)
+        if handler is not None:
+            handler(macro_id, params, ctx)
+
+    # Groove length from XA/YA to XE/YE (one delta should be zero)
+    for macro_id, xa_s, ya_s, xe_s, ye_s, t_val in groove_records:
+        xa = _safe_float(xa_s)
+        ya = _safe_float(ya_s)
+        xe = _safe_float(xe_s)
+        ye = _safe_float(ye_s)
+        if None in (xa, ya, xe, ye):
+            continue
+        dx = abs(xa - xe)
+        dy = abs(ya - ye)
+        # Tolerance instead of float equality: coordinates that round-trip
+        # through text can land a hair off axis-parallel.
+        is_pl = dy < _AXIS_EPS
+        is_pw = dx < _AXIS_EPS
+        length = dx if is_pl else (dy if is_pw else max(dx, dy))
+        is_below = macro_id == 109 and t_val.endswith("xxxxx2")
+        if macro_id == 124:
+            if is_pl:
+                length_str = f"{length}_On_PL<{la_100}>"
+            elif is_pw:
+                length_str = f"{length}_On_PW<{br_100}>"
+            else:
+                length_str = f"{length}"
+            angle124_lengths.append(length_str)
+        else:
+            suffix = "Milling_From_Below" if is_below else "Top_Saw_Grv"
+            if is_pl:
+                length_str = f"{length}_On_PL<{la_100}_{suffix}>"
+            elif is_pw:
+                length_str = f"{length}_On_PW<{br_100}_{suffix}>"
+            else:
+                length_str = f"{length}"
+            groove109_lengths.append(length_str)
+
+    # Build a mapped summary keyed by ID: one sort, one comprehension, with
+    # the description lookup bound outside the loop. Insertion order keeps
+    # the dict sorted by ID for downstream consumers.
+    get_desc = process_defs.get
     mapped_counts = {
-        mid: {
-            "count": cnt,
-            "description": process_defs.get(mid, "Unknown/Unmapped macro ID"),
-        }
+        mid: {"count": cnt, "description": get_desc(mid, "Unknown/Unmapped macro ID")}
         for mid, cnt in sorted(counts_by_id.items())
     }
 
     return {
-        "process_counts_by_id": dict(counts_by_id),
+        "process_counts_by_id": counts_by_id,
         "mapped_process_counts": mapped_counts,
-        "unknown_macro_counts": dict(unknown_ids),
-        "bohrvert_signature_counts": dict(bohrvert_sig_counts),
-        "bohrhoriz_signature_counts": dict(bohrhoriz_sig_counts),
+        "unknown_macro_counts": unknown_ids,
+        "bohrvert_signature_counts": bohrvert_sig_counts,
+        "bohrhoriz_signature_counts": bohrhoriz_sig_counts,
         "angle124_lengths": angle124_lengths,
         "groove109_lengths": groove109_lengths,
         "la_100": la_100,
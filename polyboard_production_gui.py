@@ -1,11 +1,23 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import functools
+import hashlib
+import io
+import mmap
+import os
+import shutil
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import repeat
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime
 import json
 import uuid
+import multiprocessing
 import sys
 from Detect_Processes_In_mpr_file_ import map_and_count_mpr_processes
 
@@ -15,6 +27,18 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Dark theme palette
 DARK_BG = "#1e1e1e"
 DARK_FG = "#e0e0e0"
@@ -36,6 +60,480 @@ IN="ZP500_FR.mpr"
 KAT="Composant"
 MNM="Composant"'''
 
+# All removable blocks (one today; extend this list for new variants)
+MPR_TEXT_TO_REMOVE_LIST = [MPR_TEXT_TO_REMOVE]
+
+# One compiled alternation over every removable block in both LF and
+# CRLF form: the scan and the removal stay a single pass over the file
+# no matter how many markers the list grows to.
+_BLOCK_RE = re.compile(
+    b"|".join(re.escape(form.encode("utf-8"))
+              for marker in MPR_TEXT_TO_REMOVE_LIST
+              for form in (marker, marker.replace("\n", "\r\n"))))
+
+# Same literals compiled into a Hyperscan block-mode database when the
+# optional binding is installed: SIMD-accelerated scanning for shops
+# with very large MPR corpora. Removal still goes through _BLOCK_RE.
+if HYPERSCAN_AVAILABLE:
+    _BLOCK_HSDB = hyperscan.Database()
+    _hs_literals = [re.escape(form.encode("utf-8"))
+                    for marker in MPR_TEXT_TO_REMOVE_LIST
+                    for form in (marker, marker.replace("\n", "\r\n"))]
+    _BLOCK_HSDB.compile(
+        expressions=_hs_literals,
+        ids=list(range(len(_hs_literals))),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_hs_literals))
+    _hs_local = threading.local()
+
+    def _hs_scratch():
+        # Hyperscan scratch space is not thread-safe; keep one per
+        # scanning thread so the thread pool can scan concurrently
+        scratch = getattr(_hs_local, "scratch", None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(_BLOCK_HSDB)
+            _hs_local.scratch = scratch
+        return scratch
+
+    def _hs_find_block(data):
+        """Return the leftmost block offset in data, or None."""
+        hits = []
+
+        def on_match(pat_id, start, end, flags, ctx):
+            hits.append(start)
+
+        _BLOCK_HSDB.scan(data, match_event_handler=on_match,
+                         scratch=_hs_scratch())
+        return min(hits) if hits else None
+else:
+    _BLOCK_HSDB = None
+
+# path -> ((mtime_ns, size), parsed data). Config and convention JSON
+# are re-read on every tab construction and editor open; parsing is
+# skipped while the file on disk is unchanged.
+_json_cache = {}
+
+
+def _load_json_cached(path: Path):
+    """Parse JSON from path, reusing the parse while the file is unchanged."""
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _json_cache.get(str(path))
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    raw = path.read_bytes()
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    _json_cache[str(path)] = (stamp, data)
+    return data
+
+
+# Bracketed occurrence counters appended by Polyboard, e.g. "Shelf [2]"
+_BRACKET_RE = re.compile(r'\s*\[\d+\]')
+
+# Grain direction codes: Polyboard numeric -> Cutrite letter
+GRAIN_MAP = {"0": "N", "1": "Y", "2": "X"}
+
+
+@functools.lru_cache(maxsize=None)
+def _deterministic_id(*texts: str) -> str:
+    """Deterministic UUID (uuid5) from sorted text inputs."""
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, "|".join(sorted(texts))))
+
+# MPR macro blocks: a block starts at '<NNN' at the beginning of a line
+# and runs until the next block or end of file
+_RE_100 = re.compile(r'(?ms)^\s*<\s*100\b.*?(?=^\s*<\s*\d+\b|\Z)')
+
+
+@functools.lru_cache(maxsize=64)
+def _param_re(key: str) -> re.Pattern:
+    """Compiled pattern for one KEY="value" (or bare-value) parameter."""
+    return re.compile(rf'(?i){re.escape(key)}\s*=\s*(?:"([^"]*)"|([^\s\\\r\n]+))')
+
+
+# Bytes twins for the mmap scan in _transform_mpr_file: the file is
+# searched without decoding; only captures and the final output are
+# decoded
+_RE_100_B = re.compile(rb'(?ms)^\s*<\s*100\b.*?(?=^\s*<\s*\d+\b|\Z)')
+_RE_124_B = re.compile(rb'(?ms)^\s*<\s*124\b.*?(?=^\s*<\s*\d+\b|\Z)')
+# Cheap presence probe for the 109 fast path; must accept the same
+# '<  109' spacing the block scanner does
+_RE_109_B = re.compile(rb'<\s*109\b')
+
+# Anchored check used by the jump scanner below
+_MPR_LT_B = re.compile(rb'<\s*(\d+)\b')
+
+
+@functools.lru_cache(maxsize=64)
+def _param_re_b(key: str) -> re.Pattern:
+    """Bytes twin of _param_re for searching mapped file regions."""
+    return re.compile(
+        rf'(?i){re.escape(key)}\s*=\s*(?:"([^"]*)"|([^\s\\\r\n]+))'.encode("ascii"))
+
+
+def _iter_mpr_block_starts(data):
+    """Yield (offset, macro id bytes) for each block in data.
+
+    bytes.find jumps between '<' candidates (memchr under the hood)
+    and a small anchored match validates each one, instead of crawling
+    the whole buffer with the multiline block regex. The offset is the
+    first line start of the whitespace run preceding '<' — the same
+    position the '(?m)^\\s*<' anchor produced.
+    """
+    pos = data.find(b'<')
+    while pos != -1:
+        m = _MPR_LT_B.match(data, pos)
+        if m is not None:
+            run_start = pos
+            while run_start > 0 and data[run_start - 1] in b' \t\r\n\x0b\x0c':
+                run_start -= 1
+            start = None
+            if run_start == 0 or data[run_start - 1] == 0x0A:
+                start = run_start
+            else:
+                nl = data.find(b'\n', run_start, pos)
+                if nl != -1:
+                    start = nl + 1
+            if start is not None:
+                yield start, m.group(1)
+                pos = data.find(b'<', m.end())
+                continue
+        pos = data.find(b'<', pos + 1)
+
+def _mpr_get_param(block: str, key: str) -> str:
+    # More permissive: search anywhere in the block, case-insensitive
+    m = _param_re(key).search(block)
+    if not m:
+        return ""
+    return (m.group(1) if m.group(1) is not None else m.group(2)).strip()
+
+
+_RE_KV = re.compile(r'([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?:"([^"]*)"|([^\s\\\r\n]+))')
+
+
+def _mpr_block_params(block: str) -> dict:
+    """Tokenize every KEY=VALUE pair of a block in one pass.
+
+    Keys are upper-cased to keep the case-insensitive behaviour of the
+    per-key searches; the first occurrence of a key wins, like search().
+    """
+    params = {}
+    for m in _RE_KV.finditer(block):
+        key = m.group(1).upper()
+        if key not in params:
+            value = m.group(2) if m.group(2) is not None else m.group(3)
+            params[key] = value.strip()
+    return params
+
+
+def _mpr_remove_component_block(text: str) -> tuple[str, bool]:
+    cleaned = text.replace(MPR_TEXT_TO_REMOVE, "")
+    return cleaned, cleaned != text
+
+
+def _mpr_parse_100_dims(text: str) -> tuple[float, float]:
+    """Extract LA/BR from macro 100; tolerant to whitespace/backslashes."""
+    la = br = 0.0
+    match = _RE_100.search(text)
+    if match:
+        params = _mpr_block_params(match.group(0))
+        la_val = params.get("LA", "")
+        br_val = params.get("BR", "")
+        try:
+            la = float(la_val)
+        except ValueError:
+            la = 0.0
+        try:
+            br = float(br_val)
+        except ValueError:
+            br = 0.0
+    return la, br
+
+
+def _mpr_convert_109_to_151(block: str, dims: tuple[float, float], tool_diam: float):
+    la_100, br_100 = dims
+    params = _mpr_block_params(block)
+    xa = params.get("XA", "")
+    ya = params.get("YA", "")
+    xe = params.get("XE", "")
+    ye = params.get("YE", "")
+    nb = params.get("NB", "")
+    ti = params.get("TI", "")
+    rk = params.get("RK", "")
+
+    try:
+        xa_f = float(xa); ya_f = float(ya); xe_f = float(xe); ye_f = float(ye)
+    except ValueError:
+        return None
+
+    dx = abs(xa_f - xe_f)
+    dy = abs(ya_f - ye_f)
+    ddx = xe_f - xa_f
+    ddy = ye_f - ya_f
+    along_x = dx != 0
+    groove_len = dx if along_x else dy
+
+    try:
+        nb_f = float(nb) if nb else 0.0
+    except ValueError:
+        nb_f = 0.0
+
+    rk_norm = rk.upper() if isinstance(rk, str) else "NOWRK"
+
+    if along_x:
+        xa151 = la_100 / 2 if la_100 else xa_f
+        ya151 = ya_f
+        if rk_norm == "WRKL":
+            if ddx > 0:
+                ya151 = ya_f + (nb_f / 2)
+            else:
+                ya151 = ya_f - (nb_f / 2)
+        elif rk_norm == "WRKR":
+            if ddx > 0:
+                ya151 = ya_f - (nb_f / 2)
+            else:
+                ya151 = ya_f + (nb_f / 2)
+        la151 = groove_len + tool_diam
+        br151 = nb_f
+    else:
+        xa151 = xa_f
+        if rk_norm == "WRKL":
+            if ddy > 0:
+                xa151 = xa_f - (nb_f / 2)
+            else:
+                xa151 = xa_f + (nb_f / 2)
+        elif rk_norm == "WRKR":
+            if ddy > 0:
+                xa151 = xa_f + (nb_f / 2)
+            else:
+                xa151 = xa_f - (nb_f / 2)
+        ya151 = br_100 / 2 if br_100 else ya_f
+        la151 = nb_f
+        br151 = groove_len + tool_diam
+
+    ti151 = ti
+
+    new_block = [
+        '<151 \\UflurTasche\\',
+        f'XA="{xa151}"',
+        f'YA="{ya151}"',
+        f'LA="{la151}"',
+        f'BR="{br151}"',
+        f'TI="{ti151}"',
+        'RD="0"',
+        'WI="0"',
+        'ZT="0"',
+        'XY="80"',
+        'AB="30"',
+        'AM="1"',
+        'DS="0"',
+        'T_="3"',
+        'KO="00"',
+        ''
+    ]
+    return "\n".join(new_block), ("X" if along_x else "Y"), groove_len
+
+def _transform_mpr_file(path_str: str, tool_diam: float, remove_macro_124: bool) -> dict:
+    """Transform one MPR file without writing. Pool worker: log lines
+    are collected in the result instead of touching the UI."""
+    path = Path(path_str)
+    actions = {
+        "path": path,
+        "log": [],
+        "removed_component": False,
+        "removed_124": False,
+        "remove_124_requested": remove_macro_124,
+        "remove_124_skipped": False,
+        "has_macro_124": False,
+        "converted_109_to_151": [],
+        "new_text": None,
+        "changed": False,
+        "la_100": 0.0,
+        "br_100": 0.0,
+    }
+    try:
+        with open(path, "rb") as f:
+            try:
+                raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                raw = f.read()
+    except Exception as e:
+        actions["error"] = f"Read error: {e}"
+        return actions
+
+    data = raw
+    try:
+        # Dimensions come from the macro-100 block alone, so only that
+        # block is decoded
+        m100 = _RE_100_B.search(data)
+        if m100 is not None:
+            la_100, br_100 = _mpr_parse_100_dims(m100.group(0).decode("utf-8"))
+        else:
+            la_100 = br_100 = 0.0
+        actions["la_100"] = la_100
+        actions["br_100"] = br_100
+
+        # Probe once for anything that could change the file; most MPRs
+        # in a project need no edits, so skip the block rebuild entirely
+        # when nothing applies
+        has_comp = _BLOCK_RE.search(data) is not None
+        has_124 = bool(_RE_124_B.search(data))
+        actions["has_macro_124"] = has_124
+        has_109 = _RE_109_B.search(data) is not None
+        if not (has_comp or (remove_macro_124 and has_124) or has_109):
+            actions["removed_139_InvalidMacro"] = False
+            actions["removed_component"] = False
+            if not remove_macro_124:
+                actions["remove_124_skipped"] = True
+            actions["new_text"] = bytes(data).decode("utf-8").replace("\r\n", "\n")
+            return actions
+
+        # This file will be rebuilt; keep the pristine bytes so the
+        # writer can create the backup without re-reading the file
+        orig_bytes = bytes(data)
+
+        # Remove component block (substitute only on a confirmed hit so
+        # an untouched file keeps its zero-copy mmap view)
+        if has_comp:
+            data = _BLOCK_RE.sub(b"", data)
+        actions["removed_139_InvalidMacro"] = has_comp
+        actions["removed_component"] = has_comp
+
+        # Remove 124 (optional)
+        if remove_macro_124:
+            if has_124:
+                data = _RE_124_B.sub(b"", data)
+                actions["removed_124"] = True
+        else:
+            actions["remove_124_skipped"] = True
+
+        # Process blocks: jump between '<' candidates instead of
+        # crawling the buffer with the multiline block regex
+        starts = [(start, mid.decode("ascii"))
+                  for start, mid in _iter_mpr_block_starts(data)]
+
+        # Preserve header (everything before the first <digit block)
+        header = data[:starts[0][0]] if starts else b""
+
+        # Stream kept blocks into a byte buffer instead of collecting
+        # them in a list for a final join
+        buf = io.BytesIO()
+        buf.write(header)
+        wrote_block = False
+
+        def _emit(chunk: bytes):
+            nonlocal wrote_block
+            if wrote_block:
+                buf.write(b"\n")
+            buf.write(chunk)
+            wrote_block = True
+
+        for i, (start, mid) in enumerate(starts):
+            end = starts[i + 1][0] if i + 1 < len(starts) else len(data)
+            block = data[start:end]
+            if mid == "124" and remove_macro_124:
+                continue
+            if mid == "109":
+                # T_ is only needed for 109 blocks; search just this span
+                tm = _param_re_b("T_").search(data, start, end)
+                if tm is None:
+                    t_val = ""
+                else:
+                    t_raw = tm.group(1) if tm.group(1) is not None else tm.group(2)
+                    t_val = t_raw.decode("utf-8").strip()
+                t_clean = t_val.replace('"', "").replace("!", "").strip()
+                if t_clean.endswith("xxxxx2"):
+                    actions["log"].append(f"Tool in 2 face [({la_100}, {br_100}), {tool_diam}] for {path.name}")
+                    conv = _mpr_convert_109_to_151(block.decode("utf-8"), (la_100, br_100), tool_diam)
+                    if conv:
+                        actions["log"].append(f"Converted 109 to 151 for {path.name} successfully")
+                        new151, axis, glen = conv
+                        actions["converted_109_to_151"].append(f"{path.name} axis={axis} L={glen}")
+                        _emit(new151.encode("utf-8"))
+                        actions["changed"] = True
+                        continue
+                else:
+                    actions["log"].append(f"Skipped 109 (No T_ or T_ not ending with 2 meaning Face_1 Grv) in {path.name}")
+            _emit(block)
+
+        original = bytes(data)
+        if not wrote_block:
+            actions["new_text"] = original.decode("utf-8").replace("\r\n", "\n")
+            return actions
+
+        new_bytes = buf.getvalue()
+        if new_bytes != original:
+            actions["changed"] = True
+        if actions["changed"]:
+            actions["original_bytes"] = orig_bytes
+        # The write path stays on str; normalize CRLF like read_text did
+        actions["new_text"] = new_bytes.decode("utf-8").replace("\r\n", "\n")
+        return actions
+    except Exception as e:
+        # Decode failures (e.g. non-UTF-8 files) stay per-file errors,
+        # like the original read_text guard, instead of raising through
+        # the pool and aborting the whole export
+        actions["error"] = f"Read error: {e}"
+        return actions
+    finally:
+        if isinstance(raw, mmap.mmap):
+            raw.close()
+
+
+def _summarize_one_mpr(name: str, path_str: str):
+    """Pool worker: build the process-summary entry for one MPR file."""
+    try:
+        result = map_and_count_mpr_processes(path_str)
+        mapped = result.get("mapped_process_counts", {})
+        vert_sig = result.get("bohrvert_signature_counts", {})
+        horiz_sig = result.get("bohrhoriz_signature_counts", {})
+        angle_lengths = result.get("angle124_lengths", [])
+        groove109_lengths = result.get("groove109_lengths", [])
+
+        # Summary parts: include totals for all macros (including 102/103)
+        parts = []
+        for mid, info in sorted(mapped.items()):
+            desc = info.get("description", "")
+            cnt = info.get("count", 0)
+            if cnt <= 0 or desc == "Unknown/Unmapped macro ID":
+                continue
+            if mid == 124 and angle_lengths:
+                length_vals = [str(l).split("_")[0] for l in angle_lengths]
+                length_str = ",".join(length_vals)
+                parts.append(f"{desc}:{cnt} [L={length_str}]")
+            elif mid == 109 and groove109_lengths:
+                length_vals = [str(l).split("_")[0] for l in groove109_lengths]
+                length_str = ",".join(length_vals)
+                parts.append(f"{desc}:{cnt} [L={length_str}]")
+            else:
+                parts.append(f"{desc}:{cnt}")
+
+        # Detail strings for 102/103 signatures (JSON-like)
+        vert_detail = ""
+        if vert_sig:
+            vert_detail = "@".join([f"{k}:{v}" for k, v in sorted(vert_sig.items())])
+        horiz_detail = ""
+        if horiz_sig:
+            horiz_detail = "@".join([f"{k}:{v}" for k, v in sorted(horiz_sig.items())])
+
+        entry = {
+            "summary": "@".join(parts),
+            "vert": vert_detail,
+            "horiz": horiz_detail,
+            "angle_len": "@".join([f"{l}" for l in angle_lengths]) if angle_lengths else "",
+            "groove109_len": "@".join([f"{l}" for l in groove109_lengths]) if groove109_lengths else "",
+        }
+        return name, entry, None
+    except Exception as e:
+        entry = {
+            "summary": f"ERROR: {e}",
+            "vert": "",
+            "horiz": "",
+            "angle_len": "",
+            "groove109_len": "",
+        }
+        return name, entry, str(e)
+
+
 # Column layout for cutlist CSVs (files have no headers; we map them explicitly)
 CUTLIST_COLUMNS = [
     "Reference",
@@ -72,6 +570,20 @@ CONVENTION_COLUMNS = [
 ]
 
 
+# Thumbnails rendered for the convention editor's image panel are cached
+# here so reopening the dialog skips the decode+resize entirely
+THUMB_CACHE_DIR = Path.home() / ".cache" / "polyboard"
+
+
+def get_thumb_cache_path(image_path: Path) -> Path:
+    """Cache file for an image's 300px thumbnail (path+mtime+size key)."""
+    stat = image_path.stat()
+    key = hashlib.blake2b(
+        f"{image_path}:{stat.st_mtime_ns}:{stat.st_size}".encode(),
+        digest_size=16).hexdigest()
+    return THUMB_CACHE_DIR / f"{key}.png"
+
+
 def get_app_base_dir() -> Path:
     """Directory where the script/exe lives (portable-friendly)."""
     if getattr(sys, "frozen", False):
@@ -118,15 +630,25 @@ class ConventionEditorDialog:
         self.json_path = json_path
         self.on_save_callback = on_save_callback
         self.data_df = initial_df.copy() if initial_df is not None else pd.DataFrame(columns=CONVENTION_COLUMNS)
+        # UPPER(component) -> tree iid, kept in sync by every CRUD op so
+        # uniqueness checks don't walk the whole tree
+        self._component_index = {}
         self.image_thumbs = []
-        self.image_full = {}
+        # name -> source path; full-size images are only decoded when a
+        # popup is actually opened
+        self.image_paths = {}
         self.edge_dir = edge_dir if edge_dir is not None else Path(__file__).resolve().parent / "Edge_Diagram_Ref"
+        # Thumbnails are rendered off-thread so a big gallery doesn't
+        # freeze the dialog; Tk objects are still created on the main
+        # thread via after()
+        self._thumb_executor = ThreadPoolExecutor(max_workers=2)
 
         self.window = tk.Toplevel(parent)
         self.window.title("Convention Editor")
         self.window.geometry("1200x700")
         self.window.transient(parent)
         self.window.grab_set()
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
 
         apply_dark_theme(self.window)
 
@@ -134,6 +656,12 @@ class ConventionEditorDialog:
         self._populate_tree()
         self._load_images_panel()
 
+    def _close(self):
+        # Stop the thumbnail workers with the dialog; otherwise every
+        # open/close leaks two threads for the process lifetime
+        self._thumb_executor.shutdown(wait=False, cancel_futures=True)
+        self.window.destroy()
+
     def _build_ui(self):
         top_frame = ttk.Frame(self.window, padding="8")
         top_frame.pack(fill=tk.BOTH, expand=True)
@@ -147,7 +675,7 @@ class ConventionEditorDialog:
         ttk.Button(btn_frame, text="Save All (JSON)", command=self._save_all).pack(side=tk.LEFT, padx=4)
         ttk.Button(btn_frame, text="Import Excel", command=self._import_excel).pack(side=tk.LEFT, padx=4)
         ttk.Button(btn_frame, text="Export Excel", command=self._export_excel).pack(side=tk.LEFT, padx=4)
-        ttk.Button(btn_frame, text="Close", command=self.window.destroy).pack(side=tk.RIGHT, padx=4)
+        ttk.Button(btn_frame, text="Close", command=self._close).pack(side=tk.RIGHT, padx=4)
 
         tree_frame = ttk.Frame(top_frame)
         tree_frame.pack(fill=tk.BOTH, expand=True)
@@ -200,10 +728,22 @@ class ConventionEditorDialog:
 
     def _populate_tree(self):
         self.tree.delete(*self.tree.get_children())
-        df = self.data_df
-        for _, row in df.iterrows():
-            values = [row.get(col, "") for col in CONVENTION_COLUMNS]
-            self.tree.insert("", "end", values=values)
+        self._component_index.clear()
+        df = self.data_df.reindex(columns=CONVENTION_COLUMNS).fillna("")
+        # Plain tuples via itertuples instead of boxing each row into a
+        # Series; the tree is unmapped and its display columns detached
+        # during the inserts so Tk can't schedule a redraw per row.
+        # grid_remove remembers the grid options, so grid() restores it.
+        self.tree.grid_remove()
+        self.tree.configure(displaycolumns=())
+        try:
+            for values in df.itertuples(index=False, name=None):
+                iid = self.tree.insert("", "end", values=values)
+                self._component_index[str(values[0]).strip().upper()] = iid
+        finally:
+            self.tree.configure(displaycolumns=CONVENTION_COLUMNS)
+            self.tree.grid()
+            self.tree.update_idletasks()
 
     def _load_images_panel(self):
         # Clear previous thumbs
@@ -227,30 +767,75 @@ class ConventionEditorDialog:
 
         for p in files:
             try:
-                img = Image.open(p)
-                img.thumbnail((300, 300))
-                tkimg = ImageTk.PhotoImage(img)
-                self.image_thumbs.append(tkimg)
-                self.image_full[p.name] = Image.open(p)  # store full image for zoom
+                self.image_paths[p.name] = p
                 frame = ttk.Frame(self.img_inner)
                 frame.pack(anchor="w", padx=4, pady=4, fill=tk.X)
                 ttk.Label(frame, text=p.name).pack(anchor="w")
-                lbl = tk.Label(frame, image=tkimg, bg=DARK_BG, cursor="hand2")
+                lbl = tk.Label(frame, bg=DARK_BG, cursor="hand2")
                 lbl.pack(anchor="w")
                 lbl.bind("<Button-1>", lambda e, name=p.name: self._open_image_popup(name))
+
+                cache_path = get_thumb_cache_path(p)
+                if cache_path.exists():
+                    # Cached thumbnail: one small PNG decode, no resize
+                    self._show_thumb(lbl, cache_path, p.name)
+                else:
+                    lbl.configure(text="Loading...", fg=DARK_FG)
+                    future = self._thumb_executor.submit(self._render_thumb, p, cache_path)
+                    future.add_done_callback(
+                        lambda f, lbl=lbl, cp=cache_path, name=p.name:
+                        self.window.after(0, self._thumb_ready, f, lbl, cp, name))
             except Exception as e:
                 ttk.Label(self.img_inner, text=f"{p.name} (error: {e})", foreground=DARK_FG, background=DARK_BG).pack(anchor="w", padx=4, pady=2)
 
+    @staticmethod
+    def _render_thumb(image_path: Path, cache_path: Path):
+        """Worker: decode, resize and cache one thumbnail (no Tk here)."""
+        img = Image.open(image_path)
+        img.thumbnail((300, 300))
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        img.save(cache_path, "PNG")
+
+    def _show_thumb(self, lbl, cache_path: Path, name: str):
+        try:
+            tkimg = ImageTk.PhotoImage(Image.open(cache_path))
+        except Exception as e:
+            lbl.configure(text=f"{name} (error: {e})", fg=DARK_FG)
+            return
+        self.image_thumbs.append(tkimg)  # keep reference
+        lbl.configure(image=tkimg, text="")
+
+    def _thumb_ready(self, future, lbl, cache_path: Path, name: str):
+        # Main thread (via after): attach the rendered thumbnail
+        if not lbl.winfo_exists():
+            return
+        error = future.exception()
+        if error is not None:
+            lbl.configure(text=f"{name} (error: {error})", fg=DARK_FG)
+            return
+        self._show_thumb(lbl, cache_path, name)
+
     def _open_image_popup(self, name: str):
-        if not PIL_AVAILABLE or name not in self.image_full:
+        if not PIL_AVAILABLE or name not in self.image_paths:
+            return
+        try:
+            img = Image.open(self.image_paths[name])
+            img.load()
+        except Exception as e:
+            messagebox.showerror("Image Error", f"Failed to open {name}:\n{e}")
             return
-        img = self.image_full[name]
         popup = tk.Toplevel(self.window)
         popup.title(name)
         popup.geometry("900x600")
         popup.transient(self.window)
         apply_dark_theme(popup)
 
+        def on_close():
+            img.close()
+            popup.destroy()
+
+        popup.protocol("WM_DELETE_WINDOW", on_close)
+
         canvas = tk.Canvas(popup, bg=DARK_BG, highlightthickness=0)
         vsb = ttk.Scrollbar(popup, orient="vertical", command=canvas.yview)
         hsb = ttk.Scrollbar(popup, orient="horizontal", command=canvas.xview)
@@ -276,11 +861,22 @@ class ConventionEditorDialog:
             canvas.create_image(0, 0, anchor="nw", image=tkimg)
             canvas.config(scrollregion=canvas.bbox("all"))
 
-        canvas.bind("<Configure>", lambda e: render_image())
+        resize_after = [None]
+
+        def schedule_render(event=None):
+            # Drag-resizing fires a <Configure> per pixel; coalesce them
+            # so the image is re-thumbnailed once the size settles
+            if resize_after[0] is not None:
+                canvas.after_cancel(resize_after[0])
+            resize_after[0] = canvas.after(100, render_image)
+
+        canvas.bind("<Configure>", schedule_render)
         render_image()
 
-    def _get_form_data(self) -> dict:
-        return {col: self.entries[col].get().strip() for col in CONVENTION_COLUMNS}
+    def _get_form_values(self) -> tuple:
+        # Tuple aligned to CONVENTION_COLUMNS; callers index by
+        # position, so no per-keypress dict is built
+        return tuple(self.entries[col].get().strip() for col in CONVENTION_COLUMNS)
 
     def _on_select(self, event=None):
         sel = self.tree.selection()
@@ -292,26 +888,20 @@ class ConventionEditorDialog:
             self.entries[col].insert(0, val)
 
     def _validate_unique_component(self, component: str, exclude_iid=None) -> bool:
-        component_upper = component.upper()
-        for iid in self.tree.get_children():
-            if iid == exclude_iid:
-                continue
-            vals = self.tree.item(iid, "values")
-            if vals and str(vals[0]).strip().upper() == component_upper:
-                return False
-        return True
+        existing = self._component_index.get(component.strip().upper())
+        return existing is None or existing == exclude_iid
 
     def _add_row(self):
-        data = self._get_form_data()
-        component = data.get("Component", "")
+        values = self._get_form_values()
+        component = values[0]
         if not component:
             messagebox.showwarning("Validation", "Component is required.")
             return
         if not self._validate_unique_component(component):
             messagebox.showwarning("Validation", "Component must be unique.")
             return
-        values = [data.get(col, "") for col in CONVENTION_COLUMNS]
-        self.tree.insert("", "end", values=values)
+        iid = self.tree.insert("", "end", values=values)
+        self._component_index[component.upper()] = iid
 
     def _update_row(self):
         sel = self.tree.selection()
@@ -319,33 +909,52 @@ class ConventionEditorDialog:
             messagebox.showwarning("No Selection", "Select a row to update.")
             return
         iid = sel[0]
-        data = self._get_form_data()
-        component = data.get("Component", "")
+        values = self._get_form_values()
+        component = values[0]
         if not component:
             messagebox.showwarning("Validation", "Component is required.")
             return
         if not self._validate_unique_component(component, exclude_iid=iid):
             messagebox.showwarning("Validation", "Component must be unique.")
             return
-        values = [data.get(col, "") for col in CONVENTION_COLUMNS]
+        old_vals = self.tree.item(iid, "values")
+        if old_vals:
+            old_key = str(old_vals[0]).strip().upper()
+            if self._component_index.get(old_key) == iid:
+                del self._component_index[old_key]
         self.tree.item(iid, values=values)
+        self._component_index[component.upper()] = iid
 
     def _delete_row(self):
         sel = self.tree.selection()
         if not sel:
             return
-        self.tree.delete(sel[0])
+        iid = sel[0]
+        vals = self.tree.item(iid, "values")
+        if vals:
+            key = str(vals[0]).strip().upper()
+            if self._component_index.get(key) == iid:
+                del self._component_index[key]
+        self.tree.delete(iid)
 
     def _tree_to_df(self) -> pd.DataFrame:
-        rows = []
-        for iid in self.tree.get_children():
-            vals = self.tree.item(iid, "values")
-            rows.append({col: vals[i] if i < len(vals) else "" for i, col in enumerate(CONVENTION_COLUMNS)})
-        return pd.DataFrame(rows, columns=CONVENTION_COLUMNS)
+        # tuples feed pandas' batched from_records path; pad/trim once
+        # per row instead of building a dict per row
+        n = len(CONVENTION_COLUMNS)
+        pad = ("",) * n
+        rows = [
+            (tuple(self.tree.item(iid, "values")) + pad)[:n]
+            for iid in self.tree.get_children()
+        ]
+        return pd.DataFrame.from_records(rows, columns=CONVENTION_COLUMNS)
 
     def _save_json(self, df: pd.DataFrame):
         try:
-            self.json_path.write_text(df.to_json(orient="records", force_ascii=False, indent=2), encoding="utf-8")
+            # astype(object)/where maps NaN to None so json emits null,
+            # matching what to_json produced
+            records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+            with self.json_path.open("w", encoding="utf-8") as f:
+                json.dump(records, f, ensure_ascii=False, indent=2)
             self._log_status(f"Saved JSON: {self.json_path}")
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save JSON:\n{e}")
@@ -356,12 +965,13 @@ class ConventionEditorDialog:
 
     def _save_all(self):
         df = self._tree_to_df()
-        # validation: unique Component
-        comps = df["Component"].fillna("").str.strip().str.upper()
-        if (comps == "").any():
+        # validation: unique Component (strip once; uppercase only for
+        # the duplicate check, and only when all rows passed the first)
+        comps = df["Component"].astype("string").str.strip()
+        if comps.isna().any() or (comps == "").any():
             messagebox.showwarning("Validation", "All rows must have Component.")
             return
-        if comps.duplicated().any():
+        if comps.str.upper().duplicated().any():
             messagebox.showwarning("Validation", "Component values must be unique.")
             return
         self.data_df = df
@@ -379,7 +989,13 @@ class ConventionEditorDialog:
         if not path:
             return
         try:
-            df = pd.read_excel(path)
+            # dtype=str skips pandas' type-inference pass; the data is
+            # symbolic and goes straight into the tree as text anyway.
+            # calamine reads the sheet much faster when installed.
+            try:
+                df = pd.read_excel(path, engine="calamine", dtype=str)
+            except (ImportError, ValueError):
+                df = pd.read_excel(path, dtype=str)
             missing = [c for c in CONVENTION_COLUMNS if c not in df.columns]
             if missing:
                 messagebox.showerror("Import Error", f"Missing columns: {missing}")
@@ -402,7 +1018,16 @@ class ConventionEditorDialog:
             return
         try:
             df = self._tree_to_df()
-            df.to_excel(path, index=False)
+            try:
+                # constant_memory streams rows to disk instead of
+                # building the whole workbook tree in memory
+                with pd.ExcelWriter(
+                    path, engine="xlsxwriter",
+                    engine_kwargs={"options": {"constant_memory": True}},
+                ) as writer:
+                    df.to_excel(writer, index=False)
+            except ImportError:
+                df.to_excel(path, index=False)
             messagebox.showinfo("Export", f"Exported to {path}")
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export Excel:\n{e}")
@@ -417,6 +1042,16 @@ class MPRProcessorTab:
         self.project_folder = tk.StringVar()
         self.confirm_each = tk.BooleanVar(value=False)
         self.status_text = None
+        # Log lines are buffered and flushed to the text widget at most
+        # every 50 ms so a 10k-file run doesn't redraw 10k times
+        self._log_buf = deque()
+        self._log_flush_scheduled = False
+        # Last preview result, so a Process click right after Preview
+        # doesn't rescan the folder
+        self._preview_cache = None
+        # Shared pool for the per-file scan/rewrite work; sized for I/O
+        # concurrency rather than core count
+        self._executor = ThreadPoolExecutor(max_workers=8)
         
         self._create_widgets()
     
@@ -479,20 +1114,76 @@ class MPRProcessorTab:
             # Fallback when UI not yet built
             print(message)
             return
+        self._log_buf.append(message)
+        self._schedule_log_flush()
+
+    def _schedule_log_flush(self):
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.frame.after(50, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        if not self._log_buf:
+            return
+        lines = []
+        while self._log_buf:
+            lines.append(self._log_buf.popleft())
         self.status_text.config(state=tk.NORMAL)
-        self.status_text.insert(tk.END, message + "\n")
+        self.status_text.insert(tk.END, "\n".join(lines) + "\n")
         self.status_text.see(tk.END)
         self.status_text.config(state=tk.DISABLED)
-    
+
+    def _log_status_threadsafe(self, message):
+        # deque.append is thread-safe; only the flush itself has to run
+        # on the main thread, so hand that over via the event loop
+        self._log_buf.append(message)
+        self.frame.after(0, self._schedule_log_flush)
+
+    def _find_affected(self, mpr_files: list[Path]) -> list[Path]:
+        """Run the contains-check across the pool, keeping file order."""
+        hits = self._executor.map(self._file_contains_block, mpr_files)
+        return [f for f, hit in zip(mpr_files, hits) if hit]
+
     def _get_mpr_files(self, folder: str) -> list[Path]:
-        return list(Path(folder).rglob("*.mpr"))
+        # Iterative scandir walk: reuses the dirent type info instead of
+        # a stat per entry and only builds Path objects for matches.
+        # Matching is case-insensitive like the Windows rglob it replaces.
+        files = []
+        stack = [folder]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.name.lower().endswith(".mpr") and entry.is_file(follow_symlinks=False):
+                                files.append(Path(entry.path))
+                        except OSError:
+                            continue
+            except OSError as e:
+                self._log_status(f"Error scanning {current}: {e}")
+        return files
     
     def _file_contains_block(self, file_path: Path) -> bool:
+        # Memory-map and search as bytes: no decode, no str allocation.
+        # Only presence matters here; the rewrite re-reads the file and
+        # removes every occurrence in one subn pass.
         try:
-            text = file_path.read_text(encoding="utf-8")
-            return MPR_TEXT_TO_REMOVE in text
+            with open(file_path, "rb") as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Empty files cannot be mapped (and cannot match)
+                    return False
+                with mm:
+                    if _BLOCK_HSDB is not None:
+                        return _hs_find_block(mm) is not None
+                    return _BLOCK_RE.search(mm) is not None
         except Exception as e:
-            self._log_status(f"Error reading {file_path.name}: {e}")
+            self._log_status_threadsafe(f"Error reading {file_path.name}: {e}")
             return False
     
     def _preview_files(self):
@@ -516,7 +1207,7 @@ class MPRProcessorTab:
         
         self._log_status(f"Found {len(mpr_files)} .mpr file(s). Checking for text block...")
         
-        affected = [f for f in mpr_files if self._file_contains_block(f)]
+        affected = self._find_affected(mpr_files)
         
         if not affected:
             messagebox.showinfo("No Matches", "No files contain the specified text block.")
@@ -528,23 +1219,60 @@ class MPRProcessorTab:
             preview_list += f"\n... and {len(affected) - 20} more"
         
         self._log_status(f"Found {len(affected)} file(s) that contain the text block.")
+        try:
+            self._preview_cache = {
+                "folder": folder,
+                "mtime": Path(folder).stat().st_mtime_ns,
+                "affected": affected,
+            }
+        except OSError:
+            self._preview_cache = None
         
         messagebox.showinfo(
             "Preview",
             f"{len(affected)} file(s) will be modified.\n\nFirst 20 files:\n{preview_list}"
         )
     
-    def _create_backup(self, file_path: Path):
+    def _create_backup(self, file_path: Path, data: bytes):
+        # Caller already holds the file contents; write them out verbatim
         backup_path = file_path.with_suffix(file_path.suffix + ".bak")
         if not backup_path.exists():
             try:
-                backup_path.write_text(file_path.read_text(encoding="utf-8"), encoding="utf-8")
+                backup_path.write_bytes(data)
                 return True
             except Exception as e:
-                self._log_status(f"Error creating backup for {file_path.name}: {e}")
+                self._log_status_threadsafe(f"Error creating backup for {file_path.name}: {e}")
                 return False
         return True
     
+    def _rewrite_one(self, file_path: Path) -> bool:
+        """Remove the block from one file. Pool worker; returns True if
+        the file was modified. Logs via the event loop."""
+        try:
+            # One open and one fstat cover backup, check, and rewrite;
+            # the stat result sizes the read so it lands in a single
+            # exactly-allocated buffer (stat latency adds up on network
+            # shares, a common deployment for CNC shops)
+            with open(file_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                data = f.read(size)
+            updated, removed = _BLOCK_RE.subn(b"", data)
+
+            if removed:
+                self._create_backup(file_path, data)
+                # Write to a sibling temp file and swap atomically so
+                # a crash can't leave a half-written .mpr behind
+                tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+                tmp_path.write_bytes(updated)
+                os.replace(tmp_path, file_path)
+                self._log_status_threadsafe(f"Modified: {file_path.name}")
+                return True
+
+            self._log_status_threadsafe(f"No changes needed: {file_path.name}")
+        except Exception as e:
+            self._log_status_threadsafe(f"Error processing {file_path.name}: {e}")
+        return False
+
     def _process_files(self):
         # Flow: validate folder -> gather affected -> confirm -> backup -> replace block
         folder = self.project_folder.get()
@@ -557,14 +1285,23 @@ class MPRProcessorTab:
             return
         
         self._log_status("Starting file processing...")
-        mpr_files = self._get_mpr_files(folder)
-        
-        if not mpr_files:
-            messagebox.showinfo("No Files", "No .mpr files found.")
-            return
-        
-        affected = [f for f in mpr_files if self._file_contains_block(f)]
-        
+        # Reuse the preview scan when the folder is unchanged. The
+        # directory mtime only tracks direct-child churn, but a stale
+        # hit is harmless: _rewrite_one re-reads every file anyway.
+        cache = self._preview_cache
+        if (cache is not None and cache["folder"] == folder
+                and Path(folder).stat().st_mtime_ns == cache["mtime"]):
+            affected = cache["affected"]
+            self._log_status("Reusing preview scan results.")
+        else:
+            mpr_files = self._get_mpr_files(folder)
+
+            if not mpr_files:
+                messagebox.showinfo("No Files", "No .mpr files found.")
+                return
+
+            affected = self._find_affected(mpr_files)
+
         if not affected:
             messagebox.showinfo("No Matches", "No files contain the specified text block.")
             return
@@ -592,35 +1329,29 @@ class MPRProcessorTab:
                 "Click 'No' to confirm each file individually."
             )
         
+        # Dialogs must stay on the main thread, so resolve the per-file
+        # confirmations first, then fan the rewrites out over the pool
+        to_process = []
         for file_path in affected:
-            try:
-                if self.confirm_each.get() and not confirm_all:
-                    answer = messagebox.askyesno(
-                        "Confirm Modification",
-                        f"Modify this file?\n\n{file_path.name}"
-                    )
-                    if not answer:
-                        skipped_count += 1
-                        self._log_status(f"Skipped: {file_path.name}")
-                        continue
-                
-                # Create backup
-                self._create_backup(file_path)
-                
-                # Remove text block
-                original_text = file_path.read_text(encoding="utf-8")
-                updated_text = original_text.replace(MPR_TEXT_TO_REMOVE, "")
-                
-                if updated_text != original_text:
-                    file_path.write_text(updated_text, encoding="utf-8")
-                    modified_count += 1
-                    self._log_status(f"Modified: {file_path.name}")
-                else:
-                    self._log_status(f"No changes needed: {file_path.name}")
-                    
-            except Exception as e:
-                self._log_status(f"Error processing {file_path.name}: {e}")
-        
+            if self.confirm_each.get() and not confirm_all:
+                answer = messagebox.askyesno(
+                    "Confirm Modification",
+                    f"Modify this file?\n\n{file_path.name}"
+                )
+                if not answer:
+                    skipped_count += 1
+                    self._log_status(f"Skipped: {file_path.name}")
+                    continue
+            to_process.append(file_path)
+
+        futures = [self._executor.submit(self._rewrite_one, p)
+                   for p in to_process]
+        for future in as_completed(futures):
+            if future.result():
+                modified_count += 1
+        # Files just changed; force the next run to scan fresh
+        self._preview_cache = None
+
         message = f"Processing complete.\nModified: {modified_count} file(s)"
         if skipped_count > 0:
             message += f"\nSkipped: {skipped_count} file(s)"
@@ -639,6 +1370,26 @@ class CutlistGeneratorTab:
         self.convention_file = tk.StringVar()
         self.cutlist_file = tk.StringVar()
         self.convention_df = None
+        # Derived lookup structures, rebuilt whenever the convention
+        # frame changes (see _ensure_convention_caches)
+        self._conv_cache_df = None
+        self._component_set = frozenset()
+        self._component_order = []
+        self._edge_table = {}
+        self._face_table = {}
+        # Process summaries keyed by (path, mtime_ns, size): unchanged
+        # MPRs are not re-parsed on subsequent previews/exports
+        self._mpr_summary_cache = {}
+        # Last preview result, reused by export while the inputs that
+        # produced it are unchanged (see _processing_signature)
+        self._last_processed_df = None
+        self._last_processed_sig = None
+        # (mpr_names, found_map) from the last successful validation
+        self._last_mpr_resolution = None
+        # Last recursive project-folder index, keyed by (path, mtime)
+        self._mpr_scan_cache = {}
+        self._log_buf = deque()
+        self._log_flush_scheduled = False
         # Paths/config
         self.config_path = get_config_path()
         self.base_dir = get_app_base_dir()
@@ -660,7 +1411,7 @@ class CutlistGeneratorTab:
         if not self.config_path.exists():
             return {}
         try:
-            return json.loads(self.config_path.read_text(encoding="utf-8"))
+            return _load_json_cached(self.config_path)
         except Exception as e:
             self._log_status(f"Failed to load config ({self.config_path}): {e}")
             return {}
@@ -790,6 +1541,7 @@ class CutlistGeneratorTab:
         )
         if file:
             self.convention_json_path = Path(file)
+            self._last_processed_df = None
             self._update_path_entries()
             self._log_status(f"Selected convention JSON: {file}")
     
@@ -800,6 +1552,7 @@ class CutlistGeneratorTab:
         )
         if file:
             self.cutlist_file.set(file)
+            self._last_processed_df = None
             if self.convention_path_label:
                 self.convention_path_label.config(state="normal")
                 self.convention_path_label.delete(0, tk.END)
@@ -821,8 +1574,22 @@ class CutlistGeneratorTab:
         messagebox.showinfo("Defaults Saved", f"Saved to {self.config_path}")
     
     def _log_status(self, message):
+        # Coalesce bursts of messages into one widget update, same as
+        # the MPR tab's logger
+        self._log_buf.append(message)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.frame.after(50, self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        if not self._log_buf:
+            return
+        lines = []
+        while self._log_buf:
+            lines.append(self._log_buf.popleft())
         self.status_text.config(state=tk.NORMAL)
-        self.status_text.insert(tk.END, message + "\n")
+        self.status_text.insert(tk.END, "\n".join(lines) + "\n")
         self.status_text.see(tk.END)
         self.status_text.config(state=tk.DISABLED)
     
@@ -838,7 +1605,7 @@ class CutlistGeneratorTab:
 
         if json_path.exists():
             try:
-                data = json.loads(json_path.read_text(encoding="utf-8"))
+                data = _load_json_cached(json_path)
                 df = pd.DataFrame(data)
                 missing = [col for col in CONVENTION_COLUMNS if col not in df.columns]
                 if missing:
@@ -876,57 +1643,75 @@ class CutlistGeneratorTab:
             raise FileNotFoundError(f"Cutlist file not found: {file_path}")
         
         try:
-            # Read CSV with semicolon separator; files have no headers so we assign them
+            # Read CSV with semicolon separator; files have no headers so we assign them.
+            # Everything downstream treats fields as text, so skip dtype
+            # inference and NaN sniffing: empty cells come back as ""
             df = pd.read_csv(
                 file_path,
                 sep=';',
                 encoding='utf-8',
                 header=None,
                 names=CUTLIST_COLUMNS,
+                dtype=str,
+                na_filter=False,
+                engine='c',
+                low_memory=False,
             )
             self._log_status(f"Loaded cutlist file: {len(df)} rows")
             return df
         except Exception as e:
             raise Exception(f"Error loading cutlist file: {e}")
     
+    def _ensure_convention_caches(self, convention_df: pd.DataFrame):
+        """(Re)build O(1) lookup structures when the convention changes."""
+        if self._conv_cache_df is convention_df:
+            return
+        comps = list(convention_df['Component'])
+        self._component_order = comps
+        self._component_set = frozenset(comps)
+        dedup = convention_df.drop_duplicates('Component').set_index('Component')
+        edge_cols = ['Edge_0', 'Edge_1', 'Edge_2_connect',
+                     'Edge_2_no_connect', 'Edge_3', 'Edge_4']
+        self._edge_table = dedup[[c for c in edge_cols if c in dedup.columns]].to_dict('index')
+        face_cols = ['Face_1', 'Face_2']
+        self._face_table = dedup[[c for c in face_cols if c in dedup.columns]].to_dict('index')
+        self._conv_cache_df = convention_df
+
     def _match_component(self, reference: str, convention_df: pd.DataFrame) -> str:
         """Match Reference to Component using specific rules"""
+        self._ensure_convention_caches(convention_df)
+        comp_set = self._component_set
         reference_upper = reference.upper()
         
         # Priority 1: Check for "L Side Drawer" or "R Side Drawer"
-        if "L SIDE DRAWER" in reference_upper or "R SIDE DRAWER" in reference_upper:
-            for component in convention_df['Component']:
-                if component == "Drawers Side":
-                    return component
+        if ("L SIDE DRAWER" in reference_upper or "R SIDE DRAWER" in reference_upper) \
+                and "Drawers Side" in comp_set:
+            return "Drawers Side"
         
         # Priority 2: Check for "Drawer" (without "Side")
-        if "DRAWER" in reference_upper and "SIDE DRAWER" not in reference_upper:
-            for component in convention_df['Component']:
-                if component == "Drawers (Frontage)":
-                    return component
+        if ("DRAWER" in reference_upper and "SIDE DRAWER" not in reference_upper
+                and "Drawers (Frontage)" in comp_set):
+            return "Drawers (Frontage)"
 
         # Priority 3: Double doors
-        if "DOOR" in reference_upper and "DOUBLE" in reference_upper:
-            for component in convention_df['Component']:
-                if component == "Doors (Double)":
-                    return component
+        if ("DOOR" in reference_upper and "DOUBLE" in reference_upper
+                and "Doors (Double)" in comp_set):
+            return "Doors (Double)"
 
         # Priority 3: Single Door (Std) open vs fitting side
         if "DOOR" in reference_upper and "SINGLE" in reference_upper:
             target = "Single Doors (Open Side)" if "OPEN" in reference_upper else "Single Doors (Fitting Side)"
-            for component in convention_df['Component']:
-                if component == target:
-                    return component
+            if target in comp_set:
+                return target
         
         # Priority 4: Try exact match
-        for component in convention_df['Component']:
-            if reference == component:
-                return component
+        if reference in comp_set:
+            return reference
         
         # Priority 5: Try partial match (remove brackets and numbers)
         # Clean reference: remove [1], [2], etc.
-        cleaned_ref = re.sub(r'\s*\[\d+\]', '', reference).strip()
-        for component in convention_df['Component']:
+        cleaned_ref = _BRACKET_RE.sub('', reference).strip()
+        for component in self._component_order:
             if cleaned_ref == component:
                 return component
             # Also try if cleaned reference contains component
@@ -934,14 +1719,66 @@ class CutlistGeneratorTab:
                 return component
         
         # Priority 6: Try case-insensitive partial match
-        for component in convention_df['Component']:
+        for component in self._component_order:
             if component.upper() in reference_upper or reference_upper in component.upper():
                 return component
         
         return None
     
+    def _match_component_vectorized(self, refs: pd.Series, convention_df: pd.DataFrame) -> pd.Series:
+        """Rule-based component matching over a whole reference Series.
+
+        Mirrors the priority order of _match_component for the keyword
+        rules and the exact match; references no rule resolves fall back
+        to the scalar cascade (the partial matches are order-dependent),
+        but only once per unique leftover reference.
+        """
+        comp_set = set(convention_df['Component'])
+        upper = refs.str.upper()
+
+        conditions, choices = [], []
+        # A rule only applies when its target component exists in the
+        # convention; otherwise the scalar cascade falls through too
+        if "Drawers Side" in comp_set:
+            conditions.append(upper.str.contains("L SIDE DRAWER", regex=False)
+                              | upper.str.contains("R SIDE DRAWER", regex=False))
+            choices.append("Drawers Side")
+        if "Drawers (Frontage)" in comp_set:
+            conditions.append(upper.str.contains("DRAWER", regex=False)
+                              & ~upper.str.contains("SIDE DRAWER", regex=False))
+            choices.append("Drawers (Frontage)")
+        door = upper.str.contains("DOOR", regex=False)
+        if "Doors (Double)" in comp_set:
+            conditions.append(door & upper.str.contains("DOUBLE", regex=False))
+            choices.append("Doors (Double)")
+        single = door & upper.str.contains("SINGLE", regex=False)
+        is_open = upper.str.contains("OPEN", regex=False)
+        if "Single Doors (Open Side)" in comp_set:
+            conditions.append(single & is_open)
+            choices.append("Single Doors (Open Side)")
+        if "Single Doors (Fitting Side)" in comp_set:
+            conditions.append(single & ~is_open)
+            choices.append("Single Doors (Fitting Side)")
+        # Exact match resolves to the reference itself
+        conditions.append(refs.isin(comp_set))
+        choices.append(refs)
+
+        result = pd.Series(np.select(conditions, choices, default=None),
+                           index=refs.index, dtype=object)
+
+        leftover = result.isna()
+        if leftover.any():
+            fallback = {ref: self._match_component(ref, convention_df)
+                        for ref in refs[leftover].unique()}
+            result[leftover] = refs[leftover].map(fallback)
+        return result
+
     def _count_edges(self, row: pd.Series, edge_columns: list) -> tuple:
-        """Count edge banding and determine if 2 edges are adjacent or opposite"""
+        """Count edge banding and determine if 2 edges are adjacent or opposite.
+
+        Scalar helper for single rows; _process_cutlist computes the
+        same thing column-wise for the whole frame.
+        """
         edges = []
         for col in edge_columns:
             value = str(row[col]) if pd.notna(row[col]) else ""
@@ -971,8 +1808,9 @@ class CutlistGeneratorTab:
         if component is None:
             return ""
         
-        component_row = convention_df[convention_df['Component'] == component]
-        if component_row.empty:
+        self._ensure_convention_caches(convention_df)
+        row = self._edge_table.get(component)
+        if row is None:
             return ""
         
         if edge_count == 0:
@@ -988,7 +1826,7 @@ class CutlistGeneratorTab:
         else:
             return ""
         
-        value = component_row[col].iloc[0]
+        value = row.get(col)
         if pd.isna(value):
             return ""
         
@@ -1000,21 +1838,14 @@ class CutlistGeneratorTab:
             return ""
         
         value_str = str(value).strip()
-        if value_str == "0":
-            return "N"
-        elif value_str == "1":
-            return "Y"
-        elif value_str == "2":
-            return "X"
-        else:
-            return value_str  # Return as-is if not 0, 1, or 2
+        return GRAIN_MAP.get(value_str, value_str)
     
     def _process_cutlist(self):
         """Process cutlist with all conversions (grain, component match, edge code, face name)"""
         if self.convention_df is None or self.cutlist_df is None:
             raise ValueError("Please load files first.")
         
-        df = self.cutlist_df.copy()
+        src = self.cutlist_df
         
         # Use predefined columns (since input has no headers)
         reference_col = "Reference"
@@ -1022,58 +1853,72 @@ class CutlistGeneratorTab:
         edging_col = "Edging_Diagram"
         face_col = "Face"
         edge_columns = ["Right_Edge", "Left_Edge", "Bottom_Edge", "Top_Edge"]
-        
-        unmatched_components = []
-        
-        # Process each row
-        for idx, row in df.iterrows():
-            reference = str(row[reference_col]) if pd.notna(row[reference_col]) else ""
-            
-            # 1. Convert Grain Direction
-            if grain_col and grain_col in df.columns:
-                df.at[idx, grain_col] = self._convert_grain_direction(row[grain_col])
-            
-            # 2. Match component
-            component = self._match_component(reference, self.convention_df)
-            
-            if component is None:
-                unmatched_components.append(reference)
-                continue
-            
-            # 3. Count edges and determine adjacency
-            edge_count, is_adjacent = self._count_edges(row, edge_columns)
-            
-            # 4. Get edge code
-            edge_code = self._get_edge_code(component, edge_count, is_adjacent, self.convention_df)
-            
-            # 5. Update Edging_Diagram
-            if edging_col and edging_col in df.columns:
-                df.at[idx, edging_col] = edge_code
-            
-            # 6. Add Face Name
-            if face_col and face_col in df.columns:
-                face_value = row[face_col]
-                if pd.notna(face_value):
-                    face_num = str(face_value).strip()
-                    component_row = self.convention_df[self.convention_df['Component'] == component]
-                    if not component_row.empty:
-                        if face_num == "1":
-                            face_name = component_row['Face_1'].iloc[0]
-                        elif face_num == "2":
-                            face_name = component_row['Face_2'].iloc[0]
-                        else:
-                            face_name = ""
-                        
-                        # Add Face Name column if it doesn't exist
-                        if "Face Name" not in df.columns:
-                            df.insert(len(df.columns), "Face Name", "")
-                        
-                        df.at[idx, "Face Name"] = face_name if pd.notna(face_name) else ""
-        
+
+        conv = self.convention_df
+
+        # 1. Convert Grain Direction for the whole column at once;
+        # unknown values pass through stripped, as the scalar helper did
+        grain = src[grain_col].astype("string").str.strip().fillna("")
+        mapped = grain.map(GRAIN_MAP)
+        grain_out = mapped.where(mapped.notna(), grain).astype(object)
+
+        # 2. Match components once per unique reference instead of once
+        # per row: cutlists repeat the same reference many times
+        refs = src[reference_col].map(lambda v: "" if pd.isna(v) else str(v))
+        components = self._match_component_vectorized(refs, conv)
+        matched = components.notna()
+        unmatched_components = refs[~matched].tolist()
+
+        # 3. Count edges and determine adjacency column-wise:
+        # Right+Left or Bottom+Top present means opposite, not adjacent
+        edges = src[edge_columns].astype("string").apply(lambda c: c.str.strip())
+        has_edge = edges.notna() & (edges != "") & (edges != "nan")
+        edge_count = has_edge.sum(axis=1).to_numpy()
+        opposite = ((has_edge.iloc[:, 0] & has_edge.iloc[:, 1])
+                    | (has_edge.iloc[:, 2] & has_edge.iloc[:, 3])).to_numpy()
+        is_adjacent = ~opposite
+
+        # 4./5. Edge code: align the convention to the matched component
+        # once, then pick the right edge column per row by position
+        edge_code_cols = ['Edge_0', 'Edge_1', 'Edge_2_connect',
+                          'Edge_2_no_connect', 'Edge_3', 'Edge_4']
+        conv_idx = conv.drop_duplicates('Component').set_index('Component')
+        lookup = conv_idx[edge_code_cols].reindex(components.fillna(''))
+        col_idx = np.select(
+            [edge_count == 0, edge_count == 1,
+             (edge_count == 2) & is_adjacent,
+             (edge_count == 2) & ~is_adjacent,
+             edge_count == 3],
+            [0, 1, 2, 3, 4], default=5)
+        values = lookup.to_numpy()[np.arange(len(src)), col_idx]
+        codes = pd.Series(values, index=src.index)
+        codes = codes.where(codes.notna(), "").astype(str)
+        # Unmatched rows keep whatever edging the cutlist already had
+        edging_out = codes.where(matched, src[edging_col])
+
+        # 6. Face Name via aligned convention lookups
+        face = src[face_col]
+        face_write = matched & face.notna()
+        face_names = pd.Series("", index=src.index, dtype=object)
+        if face_write.any():
+            face_num = face[face_write].map(lambda v: str(v).strip())
+            comp_sel = components[face_write]
+            face_1 = comp_sel.map(conv_idx["Face_1"])
+            face_2 = comp_sel.map(conv_idx["Face_2"])
+            names = face_1.where(face_num == "1",
+                                 face_2.where(face_num == "2", ""))
+            face_names[face_write] = names.where(names.notna(), "")
+
         if unmatched_components:
             self._log_status(f"Warning: {len(unmatched_components)} unmatched components: {set(unmatched_components)}")
         
-        return df
+        # Build the result in one step: untouched columns are shared
+        # with the source frame instead of deep-copied
+        return src.assign(**{
+            grain_col: grain_out,
+            edging_col: edging_out,
+            "Face Name": face_names,
+        })
 
     # ---------------- MPR validation & process summary helpers ----------------
     def _resolve_project_folder(self) -> Path:
@@ -1091,11 +1936,23 @@ class CutlistGeneratorTab:
             return fallback
         return path
 
+    def _processing_signature(self):
+        """Inputs that determine the processed frame; None disables reuse."""
+        cutlist = self.cutlist_file.get()
+        if not cutlist:
+            return None
+        try:
+            cutlist_mtime = os.stat(cutlist).st_mtime_ns
+            convention_mtime = os.stat(self.convention_json_path).st_mtime_ns
+        except OSError:
+            return None
+        return (cutlist, cutlist_mtime,
+                str(self.convention_json_path), convention_mtime,
+                self.tool_diameter.get(), self.remove_macro_124.get())
+
     def _generate_deterministic_id(self, *texts) -> str:
         """Deterministic UUID (uuid5) from sorted text inputs."""
-        sorted_texts = sorted(map(str, texts))
-        combined = "|".join(sorted_texts)
-        return str(uuid.uuid5(uuid.NAMESPACE_DNS, combined))
+        return _deterministic_id(*map(str, texts))
 
     def _collect_mpr_names(self, df: pd.DataFrame) -> list[str]:
         mpr_col = "Tooling_File_First_Face"
@@ -1110,230 +1967,106 @@ class CutlistGeneratorTab:
     def _locate_mpr_files(self, mpr_names: list[str], project_folder: Path) -> tuple[dict, list[str]]:
         found_map: dict[str, Path] = {}
         missing: list[str] = []
-        for name in sorted(set(mpr_names)):
+        wanted = sorted(set(mpr_names))
+
+        # Direct children first: no walk needed for the common layout
+        resolved: dict[str, Path] = {}
+        leftovers = set()
+        for name in wanted:
             direct = project_folder / name
             if direct.exists():
-                found_map[name] = direct
-                continue
-            matches = list(project_folder.rglob(name))
-            if matches:
-                found_map[name] = matches[0]
+                resolved[name] = direct
+            else:
+                leftovers.add(name)
+
+        # One recursive walk indexes the whole tree; each lookup is
+        # then O(1), and the index is cached for repeat calls
+        index: dict[str, Path] = {}
+        if leftovers:
+            index = self._project_file_index(project_folder)
+
+        for name in wanted:
+            path = resolved.get(name) or index.get(name)
+            if path is not None:
+                found_map[name] = path
             else:
                 missing.append(name)
+        if missing:
+            # A file dropped into a subfolder later won't bump the
+            # root's mtime; drop the index so the retry rescans
+            self._mpr_scan_cache = {}
         return found_map, missing
 
+    def _project_file_index(self, project_folder: Path) -> dict[str, Path]:
+        """Walk the project folder once and map file names to paths.
+
+        Cached against the folder's mtime so back-to-back previews and
+        exports reuse the same scan instead of re-walking the tree.
+        """
+        try:
+            key = (str(project_folder), project_folder.stat().st_mtime_ns)
+        except OSError:
+            key = None
+        if key is not None and key in self._mpr_scan_cache:
+            return self._mpr_scan_cache[key]
+        index: dict[str, Path] = {}
+        stack = [project_folder]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(Path(entry.path))
+                            else:
+                                index.setdefault(entry.name, Path(entry.path))
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        if key is not None:
+            # Keep only the latest folder's index
+            self._mpr_scan_cache = {key: index}
+        return index
+
     def _strip_macro_124(self, file_path: Path):
         """Remove all macro 124 blocks from an MPR file; keep .bak if not present."""
         try:
+            # One read serves both the backup and the rewrite
+            data = file_path.read_bytes()
             backup = file_path.with_suffix(file_path.suffix + ".bak")
             if not backup.exists():
-                backup.write_text(file_path.read_text(encoding="utf-8"), encoding="utf-8")
-
-            text = file_path.read_text(encoding="utf-8")
-            pattern = re.compile(r'(?ms)^\\s*<\\s*124\\s*\\\\.*?(?=^\\s*<\\s*\\d+\\s*\\\\|\\Z)')
-            cleaned = pattern.sub("", text)
-            if cleaned != text:
-                file_path.write_text(cleaned, encoding="utf-8")
+                backup.write_bytes(data)
+
+            if _RE_124_B.search(data):
+                cleaned = _RE_124_B.sub(b"", data)
+                # Atomic swap so a crash can't leave a half-written file
+                tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+                tmp_path.write_bytes(cleaned)
+                os.replace(tmp_path, file_path)
                 self._log_status(f"Removed macro 124 from {file_path.name}")
         except Exception as e:
             self._log_status(f"Failed to strip macro 124 from {file_path}: {e}")
 
     def _remove_component_block(self, text: str) -> tuple[str, bool]:
-        cleaned = text.replace(MPR_TEXT_TO_REMOVE, "")
-        return cleaned, cleaned != text
+        return _mpr_remove_component_block(text)
 
     def _get_param(self, block: str, key: str) -> str:
-        # More permissive: search anywhere in the block, case-insensitive
-        pattern = re.compile(rf'(?i){re.escape(key)}\s*=\s*(?:"([^"]*)"|([^\s\\\r\n]+))')
-        m = pattern.search(block)
-        if not m:
-            return ""
-        return (m.group(1) if m.group(1) is not None else m.group(2)).strip()
+        return _mpr_get_param(block, key)
 
     def _parse_macro_100_dims(self, text: str) -> tuple[float, float]:
         """Extract LA/BR from macro 100; tolerant to whitespace/backslashes."""
-        la = br = 0.0
-        match = re.search(r'(?ms)^\s*<\s*100\b.*?(?=^\s*<\s*\d+\b|\Z)', text)
-        if match:
-            block = match.group(0)
-            la_val = self._get_param(block, "LA")
-            br_val = self._get_param(block, "BR")
-            try:
-                la = float(la_val)
-            except ValueError:
-                la = 0.0
-            try:
-                br = float(br_val)
-            except ValueError:
-                br = 0.0
-        return la, br
+        return _mpr_parse_100_dims(text)
 
     def _convert_109_to_151(self, block: str, dims: tuple[float, float], tool_diam: float):
-        la_100, br_100 = dims
-        xa = self._get_param(block, "XA")
-        ya = self._get_param(block, "YA")
-        xe = self._get_param(block, "XE")
-        ye = self._get_param(block, "YE")
-        nb = self._get_param(block, "NB")
-        ti = self._get_param(block, "TI")
-        tval = self._get_param(block, "T_")
-        rk = self._get_param(block, "RK")
-
-        try:
-            xa_f = float(xa); ya_f = float(ya); xe_f = float(xe); ye_f = float(ye)
-        except ValueError:
-            return None
-
-        dx = abs(xa_f - xe_f)
-        dy = abs(ya_f - ye_f)
-        ddx = xe_f - xa_f
-        ddy = ye_f - ya_f
-        along_x = dx != 0
-        groove_len = dx if along_x else dy
-
-        try:
-            nb_f = float(nb) if nb else 0.0
-        except ValueError:
-            nb_f = 0.0
-
-        rk_norm = rk.upper() if isinstance(rk, str) else "NOWRK"
-
-        if along_x:
-            xa151 = la_100 / 2 if la_100 else xa_f
-            ya151 = ya_f
-            if rk_norm == "WRKL":
-                if ddx > 0:
-                    ya151 = ya_f + (nb_f / 2)
-                else:
-                    ya151 = ya_f - (nb_f / 2)
-            elif rk_norm == "WRKR":
-                if ddx > 0:
-                    ya151 = ya_f - (nb_f / 2)
-                else:
-                    ya151 = ya_f + (nb_f / 2)
-            la151 = groove_len + tool_diam
-            br151 = nb_f
-        else:
-            xa151 = xa_f
-            if rk_norm == "WRKL":
-                if ddy > 0:
-                    xa151 = xa_f - (nb_f / 2)
-                else:
-                    xa151 = xa_f + (nb_f / 2)
-            elif rk_norm == "WRKR":
-                if ddy > 0:
-                    xa151 = xa_f + (nb_f / 2)
-                else:
-                    xa151 = xa_f - (nb_f / 2)
-            ya151 = br_100 / 2 if br_100 else ya_f
-            la151 = nb_f
-            br151 = groove_len + tool_diam
-
-        ti151 = ti
-
-        new_block = [
-            '<151 \\UflurTasche\\',
-            f'XA="{xa151}"',
-            f'YA="{ya151}"',
-            f'LA="{la151}"',
-            f'BR="{br151}"',
-            f'TI="{ti151}"',
-            'RD="0"',
-            'WI="0"',
-            'ZT="0"',
-            'XY="80"',
-            'AB="30"',
-            'AM="1"',
-            'DS="0"',
-            'T_="3"',
-            'KO="00"',
-            ''
-        ]
-        return "\n".join(new_block), ("X" if along_x else "Y"), groove_len
+        return _mpr_convert_109_to_151(block, dims, tool_diam)
 
     def _transform_mpr(self, path: Path, tool_diam: float, remove_macro_124: bool) -> dict:
         """Return transformed text and actions without writing."""
-        actions = {
-            "path": path,
-            "removed_component": False,
-            "removed_124": False,
-            "remove_124_requested": remove_macro_124,
-            "remove_124_skipped": False,
-            "has_macro_124": False,
-            "converted_109_to_151": [],
-            "new_text": None,
-            "changed": False,
-            "la_100": 0.0,
-            "br_100": 0.0,
-        }
-        try:
-            text = path.read_text(encoding="utf-8")
-        except Exception as e:
-            actions["error"] = f"Read error: {e}"
-            return actions
-
-        la_100, br_100 = self._parse_macro_100_dims(text)
-        actions["la_100"] = la_100
-        actions["br_100"] = br_100
-
-        # Remove component block
-        text, removed_comp = self._remove_component_block(text)
-        actions["removed_139_InvalidMacro"] = removed_comp
-        actions["removed_component"] = removed_comp
-
-        # Detect macro 124 presence (before any optional removal)
-        pattern124 = re.compile(r'(?ms)^\s*<\s*124\b.*?(?=^\s*<\s*\d+\b|\Z)')
-        actions["has_macro_124"] = bool(pattern124.search(text))
-
-        # Remove 124 (optional)
-        if remove_macro_124:
-            cleaned_124 = pattern124.sub("", text)
-            if cleaned_124 != text:
-                actions["removed_124"] = True
-                text = cleaned_124
-        else:
-            actions["remove_124_skipped"] = True
-
-        # Process blocks
-        block_re = re.compile(r'(?ms)^\s*<\s*(\d+)\b.*?(?=^\s*<\s*\d+\b|\Z)')
-        matches = list(block_re.finditer(text))
-        
-        # Preserve header (everything before the first <digit block)
-        header = ""
-        if matches:
-            header = text[:matches[0].start()]
-        
-        out_blocks = []
-        for m in matches:
-            block = m.group(0)
-            mid = m.group(1)
-            if mid == "124" and remove_macro_124:
-                continue
-            if mid == "109":
-                t_val = self._get_param(block, "T_")
-                t_clean = t_val.replace('"', "").replace("!", "").strip()
-                if t_clean.endswith("xxxxx2"):
-                    self._log_status(f"Tool in 2 face [({la_100}, {br_100}), {tool_diam}] for {path.name}")
-                    conv = self._convert_109_to_151(block, (la_100, br_100), tool_diam)
-                    if conv:
-                        self._log_status(f"Converted 109 to 151 for {path.name} successfully")
-                        new151, axis, glen = conv
-                        actions["converted_109_to_151"].append(f"{path.name} axis={axis} L={glen}")
-                        out_blocks.append(new151)
-                        actions["changed"] = True
-                        continue
-                else:
-                    self._log_status(f"Skipped 109 (No T_ or T_ not ending with 2 meaning Face_1 Grv) in {path.name}")
-            out_blocks.append(block)
-
-        if not out_blocks:
-            actions["new_text"] = text
-            return actions
-
-        new_text = header + "\n".join(out_blocks)
-        if new_text != text:
-            actions["changed"] = True
-        actions["new_text"] = new_text
+        actions = _transform_mpr_file(str(path), tool_diam, remove_macro_124)
+        for msg in actions.pop("log", []):
+            self._log_status(msg)
         return actions
 
     def _show_mpr_changes_dialog(self, actions: list[dict]) -> bool:
@@ -1360,22 +2093,32 @@ class CutlistGeneratorTab:
         dialog.rowconfigure(0, weight=1)
         dialog.columnconfigure(0, weight=1)
 
-        for act in actions:
-            fname = Path(act["path"]).name if act.get("path") else ""
-            la100 = act.get("la_100", "")
-            br100 = act.get("br_100", "")
-            comp = "yes" if act.get("removed_139_InvalidMacro") else ""
-            m124 = ""
-            if act.get("has_macro_124"):
-                if act.get("removed_124"):
-                    m124 = "removed"
-                elif act.get("remove_124_requested") is False:
-                    m124 = "kept (toggle off)"
-                else:
-                    m124 = "present"
-            conv = ", ".join(act.get("converted_109_to_151", []))
-            err = act.get("error", "")
-            tree.insert("", "end", values=[fname, la100, br100, comp, m124, conv, err])
+        def _m124(act):
+            if not act.get("has_macro_124"):
+                return ""
+            if act.get("removed_124"):
+                return "removed"
+            if act.get("remove_124_requested") is False:
+                return "kept (toggle off)"
+            return "present"
+
+        # Precompute the rows, then insert with display columns
+        # detached so the dialog lays out once (same as the previews)
+        rows = [(
+            Path(act["path"]).name if act.get("path") else "",
+            act.get("la_100", ""),
+            act.get("br_100", ""),
+            "yes" if act.get("removed_139_InvalidMacro") else "",
+            _m124(act),
+            ", ".join(act.get("converted_109_to_151", [])),
+            act.get("error", ""),
+        ) for act in actions]
+        tree.configure(displaycolumns=())
+        try:
+            for row in rows:
+                tree.insert("", "end", values=row)
+        finally:
+            tree.configure(displaycolumns=cols)
 
         btn_frame = ttk.Frame(dialog)
         btn_frame.grid(row=2, column=0, sticky="e", pady=8, padx=8)
@@ -1396,58 +2139,39 @@ class CutlistGeneratorTab:
         return result["proceed"]
 
     def _summarize_mpr_processes(self, found_map: dict[str, Path]) -> dict[str, dict]:
+        # Per-file summaries are independent regex/count work; fan them
+        # out over processes and merge in input order
         summary_cache: dict[str, dict] = {}
+        if not found_map:
+            return summary_cache
+        # Serve unchanged files from the (path, mtime_ns, size) cache
+        # and only parse the rest
+        names, paths, keys = [], [], []
         for name, path in found_map.items():
+            path_str = str(path)
             try:
-                result = map_and_count_mpr_processes(str(path))
-                mapped = result.get("mapped_process_counts", {})
-                vert_sig = result.get("bohrvert_signature_counts", {})
-                horiz_sig = result.get("bohrhoriz_signature_counts", {})
-                angle_lengths = result.get("angle124_lengths", [])
-                groove109_lengths = result.get("groove109_lengths", [])
-
-                # Summary parts: include totals for all macros (including 102/103)
-                parts = []
-                for mid, info in sorted(mapped.items()):
-                    desc = info.get("description", "")
-                    cnt = info.get("count", 0)
-                    if cnt <= 0 or desc == "Unknown/Unmapped macro ID":
-                        continue
-                    if mid == 124 and angle_lengths:
-                        length_vals = [str(l).split("_")[0] for l in angle_lengths]
-                        length_str = ",".join(length_vals)
-                        parts.append(f"{desc}:{cnt} [L={length_str}]")
-                    elif mid == 109 and groove109_lengths:
-                        length_vals = [str(l).split("_")[0] for l in groove109_lengths]
-                        length_str = ",".join(length_vals)
-                        parts.append(f"{desc}:{cnt} [L={length_str}]")
-                    else:
-                        parts.append(f"{desc}:{cnt}")
-
-                # Detail strings for 102/103 signatures (JSON-like)
-                vert_detail = ""
-                if vert_sig:
-                    vert_detail = "@".join([f"{k}:{v}" for k, v in sorted(vert_sig.items())])
-                horiz_detail = ""
-                if horiz_sig:
-                    horiz_detail = "@".join([f"{k}:{v}" for k, v in sorted(horiz_sig.items())])
-
-                summary_cache[name] = {
-                    "summary": "@".join(parts),
-                    "vert": vert_detail,
-                    "horiz": horiz_detail,
-                    "angle_len": "@".join([f"{l}" for l in angle_lengths]) if angle_lengths else "",
-                    "groove109_len": "@".join([f"{l}" for l in groove109_lengths]) if groove109_lengths else "",
-                }
-            except Exception as e:
-                summary_cache[name] = {
-                    "summary": f"ERROR: {e}",
-                    "vert": "",
-                    "horiz": "",
-                    "angle_len": "",
-                    "groove109_len": "",
-                }
-                self._log_status(f"Process summary error for {name}: {e}")
+                st = os.stat(path_str)
+                key = (path_str, st.st_mtime_ns, st.st_size)
+            except OSError:
+                key = None
+            cached = self._mpr_summary_cache.get(key) if key else None
+            if cached is not None:
+                summary_cache[name] = cached
+                continue
+            names.append(name)
+            paths.append(path_str)
+            keys.append(key)
+        if not names:
+            return summary_cache
+        with ProcessPoolExecutor() as executor:
+            for (name, entry, err), key in zip(
+                    executor.map(_summarize_one_mpr, names, paths, chunksize=4),
+                    keys):
+                summary_cache[name] = entry
+                if err:
+                    self._log_status(f"Process summary error for {name}: {err}")
+                elif key is not None:
+                    self._mpr_summary_cache[key] = entry
         return summary_cache
 
     def _validate_and_annotate_mprs(self, processed_df: pd.DataFrame) -> pd.DataFrame | None:
@@ -1465,53 +2189,84 @@ class CutlistGeneratorTab:
             self._log_status(f"Operation aborted. Missing MPR files: {set(missing)}")
             return None
 
+        self._last_mpr_resolution = (mpr_names, found_map)
         summary_cache = self._summarize_mpr_processes(found_map)
 
         if "Tooling_File_First_Face" in processed_df.columns:
-            processed_df["MPR_Process_Summary"] = processed_df["Tooling_File_First_Face"].apply(
-                lambda v: summary_cache.get(str(v).strip(), {}).get("summary", "") if pd.notna(v) else ""
-            )
-            processed_df["Vertical_Drill_Detail"] = processed_df["Tooling_File_First_Face"].apply(
-                lambda v: summary_cache.get(str(v).strip(), {}).get("vert", "") if pd.notna(v) else ""
-            )
-            processed_df["Horizontal_Drill_Detail"] = processed_df["Tooling_File_First_Face"].apply(
-                lambda v: summary_cache.get(str(v).strip(), {}).get("horiz", "") if pd.notna(v) else ""
-            )
-            processed_df["Angle_Groove_Length"] = processed_df["Tooling_File_First_Face"].apply(
-                lambda v: summary_cache.get(str(v).strip(), {}).get("angle_len", "") if pd.notna(v) else ""
-            )
-            processed_df["Saw_Groove_Length"] = processed_df["Tooling_File_First_Face"].apply(
-                lambda v: summary_cache.get(str(v).strip(), {}).get("groove109_len", "") if pd.notna(v) else ""
-            )
-            # Edge band count
+            summary_fields = [
+                ("MPR_Process_Summary", "summary"),
+                ("Vertical_Drill_Detail", "vert"),
+                ("Horizontal_Drill_Detail", "horiz"),
+                ("Angle_Groove_Length", "angle_len"),
+                ("Saw_Groove_Length", "groove109_len"),
+            ]
+            if not summary_cache:
+                # No tooling files referenced: the summary columns are
+                # constant empties, skip the per-row lookups entirely
+                new_cols = {col: "" for col, _ in summary_fields}
+            else:
+                # Normalize the lookup key once and flatten the cache
+                # into one dict per output column, then fill each
+                # column in one pass instead of five row-wise lambdas
+                keys = processed_df["Tooling_File_First_Face"].fillna("").astype(str).str.strip().to_numpy()
+                new_cols = {}
+                for col, field in summary_fields:
+                    field_map = {k: v.get(field, "") for k, v in summary_cache.items()}
+                    new_cols[col] = [field_map.get(k, "") for k in keys]
+            # One assign appends all five columns in a single block
+            # consolidation instead of five inserts
+            processed_df = processed_df.assign(**new_cols)
+            # Edge band count, column-wise like _process_cutlist
             edge_cols = ["Right_Edge", "Left_Edge", "Bottom_Edge", "Top_Edge"]
-            def _count_edges(row):
-                count = 0
-                for c in edge_cols:
-                    val = row.get(c, "")
-                    if pd.notna(val) and str(val).strip() and str(val).strip() != "nan":
-                        count += 1
-                return count
-            processed_df["Edge_Band_Count"] = processed_df.apply(_count_edges, axis=1)
-
-            # Unique deterministic ID
-            def _make_uid(row):
-                ref = row.get("Reference", "")
-                proj = row.get("Project", "")
-                cab = row.get("Cabinet", "")
-                cln = row.get("Cutting_List_Number", "")
-                return self._generate_deterministic_id(proj, cab, ref, cln)
-            processed_df["Unique_ID"] = processed_df.apply(_make_uid, axis=1)
+            edges = processed_df[edge_cols].astype("string").apply(lambda c: c.str.strip())
+            has_edge = edges.notna() & (edges != "") & (edges != "nan")
+            processed_df["Edge_Band_Count"] = has_edge.sum(axis=1)
+
+            # Unique deterministic ID, batched over the raw column
+            # arrays instead of one apply frame per row
+            uid_cols = ["Project", "Cabinet", "Reference", "Cutting_List_Number"]
+            arrays = [
+                processed_df[c].to_numpy() if c in processed_df.columns
+                else np.full(len(processed_df), "", dtype=object)
+                for c in uid_cols
+            ]
+            # Repeated parts share (proj, cab, ref, cln) tuples, so the
+            # lru-cached hash only runs once per distinct tuple
+            det_id = _deterministic_id
+            processed_df["Unique_ID"] = [
+                det_id(str(p), str(c), str(r), str(n))
+                for p, c, r, n in zip(*arrays)
+            ]
 
         return processed_df
 
+    def _canonicalize_convention(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Force the column set and order the convention loader guarantees."""
+        missing = [col for col in CONVENTION_COLUMNS if col not in df.columns]
+        if missing:
+            df = df.copy()
+            for col in missing:
+                df[col] = ""
+        return df[[c for c in CONVENTION_COLUMNS]]
+
     def _on_convention_saved(self, df: pd.DataFrame):
+        # The editor's frame is authoritative; canonicalize it in
+        # memory instead of re-reading the file we are about to write
+        df = self._canonicalize_convention(df)
         self.convention_df = df
+        self._last_processed_df = None
         self._log_status(f"Convention updated in memory ({len(df)} rows).")
         json_path = self._get_convention_json_path()
         try:
             json_path.parent.mkdir(parents=True, exist_ok=True)
-            json_path.write_text(df.to_json(orient="records", force_ascii=False, indent=2), encoding="utf-8")
+            # Serialize plain records instead of going through pandas'
+            # JSON encoder; NaN maps to None so the file keeps nulls
+            records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+            if ORJSON_AVAILABLE:
+                json_path.write_bytes(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+            else:
+                with json_path.open("w", encoding="utf-8") as f:
+                    json.dump(records, f, ensure_ascii=False, indent=2)
             self._log_status(f"Convention JSON saved to {json_path}")
         except Exception as e:
             self._log_status(f"Failed to save convention JSON: {e}")
@@ -1521,11 +2276,6 @@ class CutlistGeneratorTab:
             self.convention_path_label.delete(0, tk.END)
             self.convention_path_label.insert(0, str(json_path))
             self.convention_path_label.config(state="readonly")
-        # Immediately reload to ensure downstream uses latest data
-        try:
-            self.convention_df = self._load_convention_file()
-        except Exception as e:
-            self._log_status(f"Failed to reload convention after save: {e}")
 
     def _open_convention_editor(self):
         try:
@@ -1538,21 +2288,26 @@ class CutlistGeneratorTab:
 
     def _populate_preview(self, df: pd.DataFrame, max_rows: int = 50):
         """Populate the preview treeview with first rows of df"""
-        # Clear existing
-        for col in self.preview_tree["columns"]:
-            self.preview_tree.heading(col, text="")
-            self.preview_tree.column(col, width=0)
-        self.preview_tree.delete(*self.preview_tree.get_children())
-
         cols = list(df.columns)
-        self.preview_tree["columns"] = cols
-        for col in cols:
-            self.preview_tree.heading(col, text=col)
-            self.preview_tree.column(col, width=140, anchor="w")
-
-        for _, row in df.head(max_rows).iterrows():
-            values = [row.get(col, "") for col in cols]
-            self.preview_tree.insert("", "end", values=values)
+        head = df.head(max_rows).fillna("")
+        tree = self.preview_tree
+        # Keep the tree unmapped for the whole mutation (clear,
+        # re-column, headings, inserts) so Tk lays out once at the
+        # end; reassigning "columns" discards the old column config,
+        # so no per-column reset pass is needed
+        tree.grid_remove()
+        try:
+            tree.delete(*tree.get_children())
+            tree["columns"] = cols
+            tree.configure(displaycolumns=())
+            for col in cols:
+                tree.heading(col, text=col)
+                tree.column(col, width=140, anchor="w")
+            for values in head.itertuples(index=False, name=None):
+                tree.insert("", "end", values=values)
+        finally:
+            tree.configure(displaycolumns=cols)
+            tree.grid()
 
         if len(df) > max_rows:
             self._log_status(f"Preview shows first {max_rows} of {len(df)} rows.")
@@ -1574,6 +2329,9 @@ class CutlistGeneratorTab:
             if processed_df is None:
                 return
             
+            self._last_processed_df = processed_df
+            self._last_processed_sig = self._processing_signature()
+
             # Show preview in table
             self._populate_preview(processed_df)
             self._log_status("Preview generated successfully.")
@@ -1589,19 +2347,40 @@ class CutlistGeneratorTab:
             return
         
         try:
-            processed_df = self._process_cutlist()
-            processed_df = self._validate_and_annotate_mprs(processed_df)
-            if processed_df is None:
-                return
-
-            # Preprocess MPR files: remove component block, strip 124, convert 109->151
-            mpr_names = self._collect_mpr_names(processed_df)
-            project_folder = self._resolve_project_folder()
-            found_map, _ = self._locate_mpr_files(mpr_names, project_folder)
-
-            actions = []
-            for path in found_map.values():
-                actions.append(self._transform_mpr(path, self.tool_diameter.get(), self.remove_macro_124.get()))
+            # Reuse the preview's frame when nothing it depends on has
+            # changed since; otherwise recompute and refresh the cache
+            sig = self._processing_signature()
+            if (self._last_processed_df is not None and sig is not None
+                    and sig == self._last_processed_sig):
+                processed_df = self._last_processed_df
+            else:
+                processed_df = self._process_cutlist()
+                processed_df = self._validate_and_annotate_mprs(processed_df)
+                if processed_df is None:
+                    return
+                self._last_processed_df = processed_df
+                self._last_processed_sig = sig
+
+            # Preprocess MPR files: remove component block, strip 124, convert 109->151.
+            # Validation already resolved the referenced MPRs; reuse
+            # that map instead of re-walking the project folder
+            if self._last_mpr_resolution is not None:
+                found_map = self._last_mpr_resolution[1]
+            else:
+                mpr_names = self._collect_mpr_names(processed_df)
+                project_folder = self._resolve_project_folder()
+                found_map, _ = self._locate_mpr_files(mpr_names, project_folder)
+
+            tool_diam = self.tool_diameter.get()
+            remove_124 = self.remove_macro_124.get()
+            paths = [str(p) for p in found_map.values()]
+            with ProcessPoolExecutor() as executor:
+                actions = list(executor.map(
+                    _transform_mpr_file, paths,
+                    repeat(tool_diam), repeat(remove_124), chunksize=4))
+            for act in actions:
+                for msg in act.pop("log", []):
+                    self._log_status(msg)
 
             # Build confirmation summary
             lines = []
@@ -1632,19 +2411,35 @@ class CutlistGeneratorTab:
                 self._log_status("Export cancelled by user before MPR modifications.")
                 return
 
-            # Apply changes
-            for act in actions:
-                if act.get("error") or not act.get("changed"):
-                    continue
-                try:
-                    path = act["path"]
-                    backup = path.with_suffix(path.suffix + ".bak")
-                    if not backup.exists():
-                        backup.write_text(path.read_text(encoding="utf-8"), encoding="utf-8")
-                    path.write_text(act["new_text"], encoding="utf-8")
-                    self._log_status(f"Applied changes to {path.name}")
-                except Exception as e:
-                    self._log_status(f"Failed to write {act.get('path')}: {e}")
+            # Apply changes; each file's backup+write is independent
+            # I/O, so fan it out and log results on the main thread
+            def _apply_one(act):
+                path = act["path"]
+                backup = path.with_suffix(path.suffix + ".bak")
+                if not backup.exists():
+                    orig = act.get("original_bytes")
+                    if orig is not None:
+                        # The transform already read the file; back up
+                        # from memory instead of copying it again
+                        backup.write_bytes(orig)
+                    else:
+                        shutil.copyfile(path, backup)
+                tmp = path.with_suffix(path.suffix + ".tmp")
+                tmp.write_text(act["new_text"], encoding="utf-8")
+                os.replace(tmp, path)
+                return path
+
+            to_apply = [a for a in actions if not a.get("error") and a.get("changed")]
+            if to_apply:
+                with ThreadPoolExecutor(max_workers=min(16, len(to_apply))) as ex:
+                    futures = {ex.submit(_apply_one, a): a for a in to_apply}
+                    for fut in as_completed(futures):
+                        act = futures[fut]
+                        try:
+                            path = fut.result()
+                            self._log_status(f"Applied changes to {path.name}")
+                        except Exception as e:
+                            self._log_status(f"Failed to write {act.get('path')}: {e}")
 
             # Build default file name: To_Cutrite_[YYMMDD]_[HHMM]_[original cutlist filename].csv
             default_name = "To_Cutrite"
@@ -1667,8 +2462,10 @@ class CutlistGeneratorTab:
             if not output_file:
                 return
             
-            # Export to CSV with semicolon separator
-            processed_df.to_csv(output_file, sep=';', index=False, encoding='utf-8')
+            # Export to CSV with semicolon separator; chunked so large
+            # cutlists are flushed in batches instead of one big string
+            processed_df.to_csv(output_file, sep=';', index=False, encoding='utf-8',
+                                chunksize=50_000)
             
             messagebox.showinfo("Success", f"Cutlist exported successfully to:\n{output_file}")
             self._log_status(f"Exported to: {output_file}")
@@ -1703,5 +2500,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the frozen (PyInstaller) build: without it each
+    # process-pool worker would re-execute the GUI entry point
+    multiprocessing.freeze_support()
     main()
 